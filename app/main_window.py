@@ -3,10 +3,9 @@ Main application window.
 """
 
 import os
-import glob
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QApplication,
                               QProgressBar, QSplitter, QMessageBox, QLabel, QPushButton)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSignal
 from app.widgets.drop_zone import DropZoneWidget
 from app.widgets.plot_widget import PlotWidget
 from app.widgets.results_table import ResultsTableWidget
@@ -14,12 +13,23 @@ from app.widgets.status_log import StatusLogWidget
 from core.data_processor import DataProcessor
 from core.file_manager import FileManager
 from core.metrics_registry import MetricsRegistry
+from read_ferro_bare import read_ferro_bare_data
 import config
 
 
+# Case variants of the results file name, so filtering needs no .lower() per file
+DATA_CSV_NAMES = frozenset({
+    config.DATA_OUTPUT_FILENAME,
+    config.DATA_OUTPUT_FILENAME.upper(),
+    config.DATA_OUTPUT_FILENAME.capitalize(),
+})
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
 
+    _excel_saved = pyqtSignal(str, bool)  # Path, success; sent from the Excel writer thread
+
     def __init__(self, metrics_registry: MetricsRegistry):
         """
         Initialize main window.
@@ -31,6 +41,11 @@ class MainWindow(QMainWindow):
         self.metrics_registry = metrics_registry
         self.data_processor = DataProcessor(metrics_registry)
         self.file_manager = None
+        self._data_cache = {}  # filename -> parsed DataFrame for plotting
+        self._last_display_key = None  # Input of the last update_display run
+        self._plotted_reference = None  # Path of the reference currently plotted
+        self._plotted_filenames = []  # Test filenames currently plotted, in order
+        self._path_by_filename = {}  # CSV file name -> path in the working directory
 
         # Window settings
         self.setWindowTitle(f"{config.APP_NAME} v{config.APP_VERSION}")
@@ -129,7 +144,14 @@ class MainWindow(QMainWindow):
         self.plot_widget.save_error.connect(
             lambda msg: self.status_log.log(msg, 'ERROR')
         )
+        self.plot_widget.save_complete.connect(
+            lambda path: self.status_log.log(f"Plot saved to {os.path.basename(path)}", 'SUCCESS')
+        )
+        self.plot_widget.plot_error.connect(
+            lambda msg: self.status_log.log(msg, 'ERROR')
+        )
         self.plot_widget.intersection_calculated.connect(self._on_intersections_calculated)
+        self._excel_saved.connect(self._on_excel_saved)
 
     def on_files_dropped(self, filepaths):
         """
@@ -143,8 +165,22 @@ class MainWindow(QMainWindow):
 
         # Determine working directory from first file
         working_dir = os.path.dirname(filepaths[0])
+        if self.file_manager is not None and self.file_manager.working_directory != working_dir:
+            # Cached curves are keyed by filename, so they belong to the old folder
+            self._data_cache.clear()
+            self._last_display_key = None
+            self._plotted_reference = None
         self.file_manager = FileManager(working_dir)
 
+        # One directory listing per drop; later lookups use this mapping
+        # scandir yields cached entry types, so no extra stat per file;
+        # hidden files (e.g. macOS "._" copies) are skipped like glob did
+        with os.scandir(working_dir) as entries:
+            self._path_by_filename = {
+                e.name: e.path for e in entries
+                if e.name.endswith(('.csv', '.CSV')) and not e.name.startswith('.') and e.is_file()
+            }
+
         # Load existing data.csv if it exists
         if self.file_manager.has_existing_results():
             self.data_processor.load_existing_data(working_dir)
@@ -163,6 +199,7 @@ class MainWindow(QMainWindow):
 
             try:
                 self.data_processor.set_reference(ref_file)
+                self._last_display_key = None
                 self.status_log.log("Reference file loaded successfully", 'SUCCESS')
             except Exception as e:
                 self.status_log.log(f"Error loading reference: {str(e)}", 'ERROR')
@@ -170,11 +207,9 @@ class MainWindow(QMainWindow):
                 return
 
             # NEW: Find ALL CSV files in the folder (except reference and data.csv)
-            import glob
-            all_csv_files = glob.glob(os.path.join(working_dir, '*.csv'))
             files_to_process = [
-                f for f in all_csv_files 
-                if os.path.basename(f).lower() != 'data.csv'  # ← Only exclude data.csv, include ref_file
+                path for name, path in self._path_by_filename.items()
+                if name not in DATA_CSV_NAMES  # ← Only exclude data.csv, include ref_file
             ]
 
             if files_to_process:
@@ -188,9 +223,8 @@ class MainWindow(QMainWindow):
                 self.status_log.log(f"Using existing reference: {os.path.basename(ref_file)}", 'INFO')
                 try:
                     # Only load reference data, don't add to results again
-                    from read_ferro_bare import read_ferro_bare_csv
-                    self.data_processor.reference_metadata, self.data_processor.reference_data = read_ferro_bare_csv(ref_file)
-                    self.data_processor.reference_filepath = ref_file
+                    self.data_processor.set_reference(ref_file)
+                    self._last_display_key = None
                 except Exception as e:
                     self.status_log.log(f"Error loading existing reference: {str(e)}", 'ERROR')
                     QMessageBox.critical(self, "Error", f"Failed to load existing reference:\n{str(e)}")
@@ -206,15 +240,16 @@ class MainWindow(QMainWindow):
             if self.data_processor.full_data_df is not None and 'Filename' in self.data_processor.full_data_df.columns:
                 existing_filenames = set(self.data_processor.full_data_df['Filename'].tolist())
 
+            base = {f: os.path.basename(f) for f in filepaths}
             files_to_process = [
                 f for f in filepaths
                 if f != ref_file
-                and os.path.basename(f).lower() != 'data.csv'
-                and os.path.basename(f) not in existing_filenames
+                and base[f] not in DATA_CSV_NAMES
+                and base[f] not in existing_filenames
             ]
 
             # Log skipped files
-            skipped = [os.path.basename(f) for f in filepaths if os.path.basename(f) in existing_filenames]
+            skipped = [base[f] for f in filepaths if base[f] in existing_filenames]
             if skipped:
                 self.status_log.log(f"Skipping already processed: {', '.join(skipped)}", 'INFO')
 
@@ -236,6 +271,7 @@ class MainWindow(QMainWindow):
         self.status_log.log(f"Processing {len(filepaths)} file(s)...", 'INFO')
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
+        self._last_display_key = None
 
         # Progress callback
         def progress_callback(current, total):
@@ -245,6 +281,8 @@ class MainWindow(QMainWindow):
         # Process files
         try:
             processed_data = self.data_processor.process_batch(filepaths, progress_callback)
+            for data, filename in processed_data:
+                self._data_cache[filename] = data
             self.status_log.log(f"Successfully processed {len(processed_data)} file(s)", 'SUCCESS')
 
             # Update display
@@ -253,14 +291,11 @@ class MainWindow(QMainWindow):
             # Save results
             self.save_results()
 
-            # Auto-save plot
-            plot_path = os.path.join(self.file_manager.working_directory, 'plot.png')
-            if self.plot_widget.save_plot(plot_path):
-                self.status_log.log(f"Plot saved to {os.path.basename(plot_path)}", 'SUCCESS')
-
-            plot_path = os.path.join(self.file_manager.working_directory, 'plot.pdf')
-            if self.plot_widget.save_plot(plot_path):
-                self.status_log.log(f"Plot saved to {os.path.basename(plot_path)}", 'SUCCESS')
+            # Auto-save plot (runs in the background, results are logged)
+            self.plot_widget.save_plots([
+                os.path.join(self.file_manager.working_directory, 'plot.png'),
+                os.path.join(self.file_manager.working_directory, 'plot.pdf'),
+            ])
 
 
         except Exception as e:
@@ -274,6 +309,15 @@ class MainWindow(QMainWindow):
         # Get full DataFrame
         results_df = self.data_processor.get_results_dataframe()
 
+        # Skip the rebuild if neither the reference nor the result rows changed
+        display_key = (
+            id(self.data_processor.reference_data),
+            tuple(results_df['Filename']) if not results_df.empty else ()
+        )
+        if display_key == self._last_display_key:
+            return
+        self._last_display_key = display_key
+
         # Filter to show only key columns: Filename, is_reference, and metric columns
         if not results_df.empty:
             metric_names = self.metrics_registry.get_metric_names()
@@ -289,21 +333,50 @@ class MainWindow(QMainWindow):
 
         # Update plot - need to load CSV files for plot data
         if self.data_processor.reference_data is not None and self.file_manager is not None and not results_df.empty:
-            test_data = []
-            test_rows = results_df[results_df['is_reference'] == False]
-
-            for _, row in test_rows.iterrows():
-                filename = row['Filename']
-                filepath = os.path.join(self.file_manager.working_directory, filename)
-                if os.path.exists(filepath):
-                    try:
-                        from read_ferro_bare import read_ferro_bare_csv
-                        _, data = read_ferro_bare_csv(filepath)
-                        test_data.append((data, filename))
-                    except Exception as e:
-                        self.status_log.log(f"Warning: Could not load {filename}: {str(e)}", 'WARNING')
-
-            self.plot_widget.plot_data(self.data_processor.reference_data, test_data)
+            test_rows = self.data_processor.get_results_dataframe(include_reference=False)
+            filenames = test_rows['Filename'].tolist()
+
+            # If rows were only appended for the same reference, add just the new curves
+            n_plotted = len(self._plotted_filenames)
+            incremental = (
+                self.data_processor.reference_filepath == self._plotted_reference
+                and filenames[:n_plotted] == self._plotted_filenames
+            )
+            if incremental:
+                self.plot_widget.append_curves(self._load_test_data(filenames[n_plotted:]))
+            else:
+                self.plot_widget.plot_data(self.data_processor.reference_data,
+                                           self._load_test_data(filenames))
+            self._plotted_reference = self.data_processor.reference_filepath
+            self._plotted_filenames = filenames
+
+    def _load_test_data(self, filenames):
+        """
+        Get curve data for plotting, reading files only on cache miss.
+
+        Args:
+            filenames: Test file names in the working directory
+
+        Returns:
+            List of tuples (data_df, filename)
+        """
+        test_data = []
+        for filename in filenames:
+            data = self._data_cache.get(filename)
+            if data is not None:
+                test_data.append((data, filename))
+                continue
+
+            filepath = self._path_by_filename.get(filename)
+            if filepath is not None:
+                try:
+                    data = read_ferro_bare_data(filepath)
+                    self._data_cache[filename] = data
+                    test_data.append((data, filename))
+                except Exception as e:
+                    self.status_log.log(f"Warning: Could not load {filename}: {str(e)}", 'WARNING')
+
+        return test_data
 
     def save_results(self):
         """Save results to CSV and Excel."""
@@ -311,12 +384,25 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            csv_path, excel_path = self.data_processor.save_results(self.file_manager.working_directory)
+            csv_path, excel_path, excel_future = self.data_processor.save_results(
+                self.file_manager.working_directory, write_excel=True
+            )
             self.status_log.log(f"Results saved to {os.path.basename(csv_path)}", 'SUCCESS')
-            self.status_log.log(f"Results saved to {os.path.basename(excel_path)}", 'SUCCESS')
+
+            # The workbook is written in the background; log it when done
+            excel_future.add_done_callback(
+                lambda future: self._excel_saved.emit(excel_path, future.result())
+            )
         except Exception as e:
             self.status_log.log(f"Error saving results: {str(e)}", 'ERROR')
 
+    def _on_excel_saved(self, excel_path, success):
+        """Log the outcome of a background Excel export."""
+        if success:
+            self.status_log.log(f"Results saved to {os.path.basename(excel_path)}", 'SUCCESS')
+        else:
+            self.status_log.log(f"Could not save {os.path.basename(excel_path)}", 'WARNING')
+
     def _calculate_intersections(self):
         """Calculate intersections for all drawn lines."""
         self.plot_widget.calculate_all_intersections()
@@ -0,0 +1,121 @@
+"""
+Batched line-vs-curve intersection kernel for the plot widget.
+"""
+
+import numpy as np
+
+
+def build_segments(curves, dtype=np.float32):
+    """
+    Stack the segments of several curves into one table.
+
+    float32 halves the memory streamed per drawn line; that precision is
+    ample for placing intersection markers on screen.
+
+    Args:
+        curves: List of (x, y) numpy arrays, one pair per curve
+        dtype: Float dtype of the table
+
+    Returns:
+        Dict with arrays x3, y3 (segment start), dx, dy (segment vector),
+        xmin, xmax, ymin, ymax (segment bounding box), int array owner
+        (index of the curve in `curves`), plus the x index: order (segments
+        sorted by xmin), xmin_sorted and max_width (widest segment in x)
+    """
+    columns = ('x3', 'y3', 'dx', 'dy', 'xmin', 'xmax', 'ymin', 'ymax', 'owner')
+    parts = {name: [] for name in columns}
+    for i, (x, y) in enumerate(curves):
+        x = np.ascontiguousarray(x, dtype=dtype)
+        y = np.ascontiguousarray(y, dtype=dtype)
+        if len(x) < 2:
+            continue
+        parts['x3'].append(x[:-1])
+        parts['y3'].append(y[:-1])
+        parts['dx'].append(np.diff(x))
+        parts['dy'].append(np.diff(y))
+        # Bounding boxes let find_intersections skip most segments cheaply
+        parts['xmin'].append(np.minimum(x[:-1], x[1:]))
+        parts['xmax'].append(np.maximum(x[:-1], x[1:]))
+        parts['ymin'].append(np.minimum(y[:-1], y[1:]))
+        parts['ymax'].append(np.maximum(y[:-1], y[1:]))
+        parts['owner'].append(np.full(len(x) - 1, i, dtype=np.intp))
+
+    if not parts['owner']:
+        segments = {name: np.empty(0, dtype=dtype) for name in columns}
+        segments['owner'] = np.empty(0, dtype=np.intp)
+    else:
+        segments = {name: np.concatenate(parts[name]) for name in columns}
+
+    # Sorted-x index: a line can only hit segments whose xmin lies within
+    # one segment width left of the line's x range
+    segments['order'] = np.argsort(segments['xmin'], kind='stable')
+    segments['xmin_sorted'] = segments['xmin'][segments['order']]
+    widths = segments['xmax'] - segments['xmin']
+    segments['max_width'] = float(np.nanmax(widths)) if len(widths) else 0.0
+    return segments
+
+
+def find_intersections(x0, y0, x1, y1, segments):
+    """
+    Intersect the segment (x0, y0) -> (x1, y1) with every segment in the table.
+
+    Candidate segments come from a binary search on the sorted x index;
+    those whose bounding box misses the line's are skipped. Segments with |denominator| < 1e-10 are treated as parallel.
+    Bounds are inclusive on both segments.
+
+    Args:
+        x0, y0: Start point of the line
+        x1, y1: End point of the line
+        segments: Table from build_segments()
+
+    Returns:
+        Tuple (owner, x, y) of arrays, ordered by curve then segment
+    """
+    x_lo, x_hi = min(x0, x1), max(x0, x1)
+
+    # Binary search the x index for the window of possible segments (the
+    # width margin is doubled to stay safe against rounding), back in table order.
+    # Bounds are cast to the table dtype, or searchsorted would upcast the whole array.
+    xmin_sorted = segments['xmin_sorted']
+    as_table = xmin_sorted.dtype.type
+    lo = np.searchsorted(xmin_sorted, as_table(x_lo - 2 * segments['max_width']), side='left')
+    hi = np.searchsorted(xmin_sorted, as_table(x_hi), side='right')
+    window = np.sort(segments['order'][lo:hi])
+
+    # Only segments whose bounding box overlaps the line's can intersect it
+    overlap = segments['xmax'][window] >= x_lo
+    overlap &= segments['xmin'][window] <= x_hi
+    overlap &= segments['ymax'][window] >= min(y0, y1)
+    overlap &= segments['ymin'][window] <= max(y0, y1)
+    candidates = window[overlap]
+
+    dx = segments['dx'][candidates]
+    dy = segments['dy'][candidates]
+    ex = x0 - x1
+    ey = y0 - y1
+
+    # rx, ry: line start relative to each segment start (reused in place)
+    rx = x0 - segments['x3'][candidates]
+    ry = y0 - segments['y3'][candidates]
+
+    denom = ey * dx
+    denom -= ex * dy
+
+    t = ry * dx
+    t -= rx * dy
+    u = ey * rx
+    u -= ex * ry
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t /= denom
+        u /= denom
+
+    valid = np.abs(denom) >= 1e-10
+    valid &= t >= 0
+    valid &= t <= 1
+    valid &= u >= 0
+    valid &= u <= 1
+
+    # Interpolate the hit points along the line in double precision
+    t_hit = t[valid].astype(np.float64)
+    return segments['owner'][candidates[valid]], x0 + t_hit * (x1 - x0), y0 + t_hit * (y1 - y0)
@@ -72,7 +72,7 @@ class DropZoneWidget(QWidget):
         files = []
         for url in event.mimeData().urls():
             filepath = url.toLocalFile()
-            if filepath.endswith('.csv'):
+            if filepath.endswith(('.csv', '.CSV')):
                 files.append(filepath)
 
         if files:
@@ -2,24 +2,218 @@
 Interactive plot widget using Plotly for displaying electrochemical curves.
 """
 
+import os
+import json
+import pkgutil
+import tempfile
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy, QFileDialog
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebEngineCore import QWebEngineProfile
 from PyQt6.QtWebChannel import QWebChannel
-from PyQt6.QtCore import pyqtSignal, QObject, pyqtSlot
-import plotly.graph_objects as go
-import plotly.io as pio
+from PyQt6.QtCore import (pyqtSignal, QObject, pyqtSlot, QUrl, QTimer, QRunnable, QThreadPool,
+                          QStandardPaths)
 import numpy as np
 import config
+from app.widgets._intersect_kernel import build_segments, find_intersections
+from utils.lttb import lttb
+
+
+_go_module = None
+
+
+def _go():
+    """Import plotly.graph_objects on first use (it is slow to import)."""
+    global _go_module
+    if _go_module is None:
+        import plotly.graph_objects
+        _go_module = plotly.graph_objects
+    return _go_module
+
+
+_empty_plot_json = None
+
+
+def _empty_plot():
+    """Return the serialized empty-state figure, built once (template expansion is slow)."""
+    global _empty_plot_json
+    if _empty_plot_json is None:
+        layout = _go().Layout(
+            title='Cyclic Voltammetry Curves',
+            xaxis_title='Potential (V)',
+            yaxis_title='Current (A)',
+            template=config.PLOT_TEMPLATE,
+            showlegend=True,
+        )
+        _empty_plot_json = _plotly_json({'data': [], 'layout': layout.to_plotly_json()})
+    return _empty_plot_json
+
+
+def _write_atomic(path, data):
+    """Write bytes to path via a temp file, so readers never see a partial file."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _figure_snapshot(fig):
+    """Copy a figure's data and layout as plain dicts, without Figure.to_dict's array encoding."""
+    return {
+        'data': [trace.to_plotly_json() for trace in fig.data],
+        'layout': fig.layout.to_plotly_json(),
+    }
+
+
+def _plotly_json(obj):
+    """
+    Serialize a figure/trace dict snapshot the way the plot page expects.
+
+    Converts numpy arrays to base64 typed arrays in place where plotly
+    supports it, so only pass snapshots that nothing else uses.
+    """
+    import plotly.io as pio
+    try:
+        from _plotly_utils.utils import convert_to_base64
+    except ImportError:  # plotly < 6 sends plain lists
+        pass
+    else:
+        convert_to_base64(obj)
+    return pio.json.to_json_plotly(obj)
+
+
+# Configure interactivity
+PLOTLY_CONFIG = {
+    'editable': False,  # Disabled to allow eraseshape to work
+    'displayModeBar': True,
+    'responsive': True,
+    'modeBarButtonsToAdd': ['drawline', 'eraseshape'],
+    'modeBarButtonsToRemove': ['lasso2d', 'select2d'],
+    'toImageButtonOptions': {
+        'format': 'png',
+        'height': config.PLOT_EXPORT_HEIGHT,
+        'width': config.PLOT_EXPORT_WIDTH,
+        'scale': config.PLOT_EXPORT_SCALE
+    },
+    'displaylogo': False,
+}
+
+# All min markers and all max markers share one trace each, placed right
+# after the reference line so appended curves can extend them by index
+MIN_MARKER_TRACE = 1
+MAX_MARKER_TRACE = 2
+
+# Static page loaded once into the web view. Figure JSON is streamed in over
+# QWebChannel (bridge.command), which also reports drawn lines back to Python.
+PAGE_HTML = '''<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<style>
+html, body, #g { height: 100%; margin: 0; }
+</style>
+<script src="plotly.min.js"></script>
+<script src="qrc:///qtwebchannel/qwebchannel.js"></script>
+</head>
+<body>
+<div id="g"></div>
+<script>
+var bridge = null;
+new QWebChannel(qt.webChannelTransport, function(channel) {
+    bridge = channel.objects.bridge;
+    bridge.command.connect(function(name, payload) {
+        commands[name](JSON.parse(payload));
+    });
+    // Python holds commands back until this handshake
+    bridge.page_ready();
+});
+
+var plotConfig = __PLOTLY_CONFIG__;
+
+// Track shapes to detect new ones
+var previousShapeCount = 0;
+var listening = false;
+
+function onRelayout(data) {
+    var plotDiv = document.getElementById('g');
+    if (bridge && plotDiv.layout && plotDiv.layout.shapes) {
+        var shapes = plotDiv.layout.shapes;
+        if (shapes.length > previousShapeCount) {
+            // New shape added
+            var last = shapes[shapes.length - 1];
+            if (last && last.type === 'line') {
+                bridge.on_line_drawn(last.x0, last.y0, last.x1, last.y1);
+            }
+        }
+        previousShapeCount = shapes.length;
+    }
+}
+
+function render(fig) {
+    var plotDiv = document.getElementById('g');
+    Plotly.react(plotDiv, fig.data, fig.layout || {}, plotConfig);
+    previousShapeCount = (plotDiv.layout.shapes || []).length;
+    if (!listening) {
+        plotDiv.on('plotly_relayout', onRelayout);
+        listening = true;
+    }
+}
+
+var commands = {
+    render: render,
+    addTraces: function(traces) { Plotly.addTraces('g', traces); },
+    extendTraces: function(p) { Plotly.extendTraces('g', p.update, p.indices); }
+};
+</script>
+</body>
+</html>
+'''
+
+
+class _JsonTask(QRunnable):
+    """Serialize a plot payload to JSON on a worker thread."""
+
+    def __init__(self, payload, done):
+        super().__init__()
+        self.payload = payload
+        self.done = done
+
+    def run(self):
+        # An exception escaping run() would abort the process, so report it
+        try:
+            text = _plotly_json(self.payload)
+        except Exception as e:
+            self.done('', f"Error preparing plot update: {str(e)}")
+        else:
+            self.done(text, '')
+
+
+class _ExportTask(QRunnable):
+    """Write a figure snapshot to image files on the export thread."""
+
+    def __init__(self, export, snapshot, filepaths):
+        super().__init__()
+        self.export = export
+        self.snapshot = snapshot
+        self.filepaths = filepaths
+
+    def run(self):
+        self.export(self.snapshot, self.filepaths)
 
 
 class PlotBridge(QObject):
     """Bridge for JavaScript to Python communication."""
 
+    command = pyqtSignal(str, str)  # Page command name, JSON payload
+
     def __init__(self, plot_widget):
         super().__init__()
         self.plot_widget = plot_widget
 
+    @pyqtSlot()
+    def page_ready(self):
+        """Called from JavaScript once the channel is connected."""
+        self.plot_widget.handle_page_ready()
+
     @pyqtSlot(float, float, float, float)
     def on_line_drawn(self, x0, y0, x1, y1):
         """Called from JavaScript when a line is drawn."""
@@ -30,7 +224,11 @@ class PlotWidget(QWidget):
     """Widget for embedded interactive Plotly plotting."""
 
     save_error = pyqtSignal(str)  # Signal to report save errors
+    save_complete = pyqtSignal(str)  # Path of a plot file that was saved
     intersection_calculated = pyqtSignal(int)  # Reports number of intersections found
+    plot_error = pyqtSignal(str)  # Signal to report failed plot updates
+    _json_ready = pyqtSignal(int, int, str, str)  # generation, job id, serialized payload, error message ('' on success)
+    _export_done = pyqtSignal(str, str)  # filepath, error message ('' on success)
 
     def __init__(self):
         """Initialize plot widget."""
@@ -44,11 +242,33 @@ class PlotWidget(QWidget):
         profile = QWebEngineProfile.defaultProfile()
         profile.downloadRequested.connect(self._handle_download)
 
+        # Plot page state: loaded once, then updated via Plotly.react
+        self._page_dir = None  # Directory holding plot.html and plotly.min.js
+        self._page_ready = False
+        self._pending_commands = []  # (name, json) sent before the page was ready
+
+        # Payloads are serialized off the UI thread; commands are still sent in order
+        self._js_jobs = []  # [job id, command name, json or None]
+        self._js_generation = 0  # Bumped by full renders to drop stale jobs
+        self._next_job_id = 0
+        self._json_ready.connect(self._on_json_ready)
+
         # Store current figure for saving
         self.current_fig = None
 
+        # Image export runs on its own single thread, so kaleido is never
+        # used concurrently; the two attributes below belong to that thread
+        self._export_pool = QThreadPool(self)
+        self._export_pool.setMaxThreadCount(1)
+        self._last_saved_hashes = {}  # filepath -> figure hash written there
+        self._kaleido_scope = None  # Created on first export
+        self._export_done.connect(self._on_export_done)
+
         # Store curve data for intersection calculations
-        self.curve_data = {}
+        self.curve_data = {}  # name -> (potential, current) float64 arrays
+        self._segments = None  # Stacked segments of curve_data, built on first use
+        self._test_curve_count = 0  # Test curves plotted so far (drives colors)
+        self._colors = None  # Template colorway, resolved on first plot
 
         # Store drawn lines for intersection calculations
         self.drawn_lines = []  # List of (x0, y0, x1, y1) tuples
@@ -65,20 +285,16 @@ class PlotWidget(QWidget):
         layout.addWidget(self.web_view)
         self.setLayout(layout)
 
-        # Initialize with empty plot
-        self.clear_plot()
+        # Initialize with empty plot once the event loop runs, so the window
+        # can be shown before plotly is imported
+        QTimer.singleShot(0, self.clear_plot)
 
     def clear_plot(self):
         """Clear the plot and show empty state."""
-        fig = go.Figure()
-        fig.update_layout(
-            title='Cyclic Voltammetry Curves',
-            xaxis_title='Potential (V)',
-            yaxis_title='Current (A)',
-            template=config.PLOT_TEMPLATE,
-            showlegend=True,
-        )
-        self._render_figure(fig)
+        self.current_fig = None
+        self._drop_queued_commands()
+        self._ensure_page()
+        self._send('render', _empty_plot())
 
     def plot_data(self, reference_data, test_data_list):
         """
@@ -88,18 +304,30 @@ class PlotWidget(QWidget):
             reference_data: DataFrame with Potential_V and Current_A columns
             test_data_list: List of tuples (data_df, filename)
         """
-        fig = go.Figure()
+        go = _go()
 
-        # Store curve data for intersection calculations
-        self.curve_data = {'Reference': reference_data}
-        for data, filename in test_data_list:
-            if 'BARE' not in filename.upper() and 'REFERENCE' not in filename.upper():
-                self.curve_data[filename] = data
+        # Collect traces and build the figure once (add_trace revalidates each time)
+        traces = []
+
+        # Skip reference files once; keep list positions so colors stay stable
+        plottable = [
+            (i, self._curve_arrays(data), filename) for i, (data, filename) in enumerate(test_data_list)
+            if not self._is_reference_name(filename)
+        ]
+
+        # Store curve arrays for intersection calculations
+        ref_pot, ref_cur = self._curve_arrays(reference_data)
+        self.curve_data = {'Reference': (ref_pot, ref_cur)}
+        for _, arrays, filename in plottable:
+            self.curve_data[filename] = arrays
+        self._segments = None
+
+        plot_pot, plot_cur = lttb(ref_pot, ref_cur, config.PLOT_MAX_POINTS)
 
         # Plot reference curve with thick magenta line
-        fig.add_trace(go.Scatter(
-            x=reference_data[config.POTENTIAL_COLUMN],
-            y=reference_data[config.CURRENT_COLUMN],
+        traces.append(self._line_trace_type(len(plot_pot))(
+            x=plot_pot,
+            y=plot_cur,
             mode='lines',
             name='Reference',
             line=dict(
@@ -109,85 +337,23 @@ class PlotWidget(QWidget):
             hovertemplate='<b>Reference</b><br>Potential: %{x:.4f} V<br>Current: %{y:.2e} A<extra></extra>'
         ))
 
-        # Find global min/max for reference
-        ref_min_idx = reference_data[config.CURRENT_COLUMN].idxmin()
-        ref_max_idx = reference_data[config.CURRENT_COLUMN].idxmax()
-
-        # Add min marker
-        fig.add_trace(go.Scatter(
-            x=[reference_data.loc[ref_min_idx, config.POTENTIAL_COLUMN]],
-            y=[reference_data.loc[ref_min_idx, config.CURRENT_COLUMN]],
-            mode='markers',
-            marker=dict(size=12, color='limegreen', symbol='triangle-down'),
-            name='Reference Min',
-            hovertemplate='<b>Reference Min</b><br>Potential: %{x:.4f} V<br>Current: %{y:.2e} A<extra></extra>',
-            showlegend=False
-        ))
-
-        # Add max marker
-        fig.add_trace(go.Scatter(
-            x=[reference_data.loc[ref_max_idx, config.POTENTIAL_COLUMN]],
-            y=[reference_data.loc[ref_max_idx, config.CURRENT_COLUMN]],
-            mode='markers',
-            marker=dict(size=12, color='limegreen', symbol='triangle-up'),
-            name='Reference Max',
-            hovertemplate='<b>Reference Max</b><br>Potential: %{x:.4f} V<br>Current: %{y:.2e} A<extra></extra>',
-            showlegend=False
-        ))
+        # Global min/max per curve (on full data, not the downsampled curve)
+        extrema = [('Reference',) + self._curve_extrema(ref_pot, ref_cur)]
 
         # Plot test curves
-        if test_data_list:
-            # Use Plotly's default color sequence
-            colors = pio.templates[config.PLOT_TEMPLATE].layout.colorway
-            if not colors:
-                colors = pio.templates['plotly'].layout.colorway
+        colors = self._colorway()
+        test_traces = []
+        for i, (pot, cur), filename in plottable:
+            test_traces.append(self._test_curve_trace(pot, cur, filename, colors[i % len(colors)]))
+            extrema.append((filename,) + self._curve_extrema(pot, cur))
+        self._test_curve_count = len(test_data_list)
 
-            for i, (data, filename) in enumerate(test_data_list):
-                # Skip reference files
-                if 'BARE' in filename.upper() or 'REFERENCE' in filename.upper():
-                    continue
-
-                color = colors[i % len(colors)]
-
-                fig.add_trace(go.Scatter(
-                    x=data[config.POTENTIAL_COLUMN],
-                    y=data[config.CURRENT_COLUMN],
-                    mode='lines',
-                    name=filename,
-                    line=dict(width=1.5),
-                    opacity=config.TEST_LINE_ALPHA,
-                    hovertemplate=f'<b>{filename}</b><br>Potential: %{{x:.4f}} V<br>Current: %{{y:.2e}} A<extra></extra>'
-                ))
-
-                # Find global min/max for this test curve
-                test_min_idx = data[config.CURRENT_COLUMN].idxmin()
-                test_max_idx = data[config.CURRENT_COLUMN].idxmax()
-
-                # Add min marker (triangle-down)
-                fig.add_trace(go.Scatter(
-                    x=[data.loc[test_min_idx, config.POTENTIAL_COLUMN]],
-                    y=[data.loc[test_min_idx, config.CURRENT_COLUMN]],
-                    mode='markers',
-                    # marker=dict(size=12, color=config.REFERENCE_LINE_COLOR, symbol='triangle-down'),
-                    marker=dict(size=12, color='limegreen', symbol='triangle-down'),
-                    name=f'{filename} Min',
-                    hovertemplate=f'<b>{filename} Min</b><br>Potential: %{{x:.4f}} V<br>Current: %{{y:.2e}} A<extra></extra>',
-                    showlegend=False
-                ))
-
-                # Add max marker (triangle-up)
-                fig.add_trace(go.Scatter(
-                    x=[data.loc[test_max_idx, config.POTENTIAL_COLUMN]],
-                    y=[data.loc[test_max_idx, config.CURRENT_COLUMN]],
-                    mode='markers',
-                    # marker=dict(size=12, color=config.REFERENCE_LINE_COLOR, symbol='triangle-up'),
-                    marker=dict(size=12, color='limegreen', symbol='triangle-up'),
-                    name=f'{filename} Max',
-                    hovertemplate=f'<b>{filename} Max</b><br>Potential: %{{x:.4f}} V<br>Current: %{{y:.2e}} A<extra></extra>',
-                    showlegend=False
-                ))
+        # Reference line, then the min/max marker traces, then the test curves
+        traces.extend(self._extrema_traces(extrema))
+        traces.extend(test_traces)
 
         # Update layout
+        fig = go.Figure(data=traces)
         fig.update_layout(
             title=dict(
                 text='Cyclic Voltammetry Curves',
@@ -214,73 +380,262 @@ class PlotWidget(QWidget):
 
         self._render_figure(fig)
 
+    def append_curves(self, test_data_list):
+        """
+        Add test curves to the current plot without re-rendering it.
+
+        Only the new traces are serialized and appended in the page with
+        Plotly.addTraces.
+
+        Args:
+            test_data_list: List of tuples (data_df, filename)
+        """
+        if self.current_fig is None or not test_data_list:
+            return
+
+        colors = self._colorway()
+        new_traces = []
+        extrema = []
+        for data, filename in test_data_list:
+            i = self._test_curve_count
+            self._test_curve_count += 1
+
+            # Skip reference files
+            if self._is_reference_name(filename):
+                continue
+
+            pot, cur = self.curve_data[filename] = self._curve_arrays(data)
+            self._segments = None
+            new_traces.append(self._test_curve_trace(pot, cur, filename, colors[i % len(colors)]))
+            extrema.append((filename,) + self._curve_extrema(pot, cur))
+
+        if not new_traces:
+            return
+
+        self._add_traces(new_traces)
+
+        # Extend the shared min/max marker traces with the new curves' points
+        names = [name for name, _, _ in extrema]
+        update = {'x': [], 'y': [], 'hovertext': []}
+        for index, k in ((MIN_MARKER_TRACE, 1), (MAX_MARKER_TRACE, 2)):
+            xs = [e[k][0] for e in extrema]
+            ys = [e[k][1] for e in extrema]
+            marker_trace = self.current_fig.data[index]
+            marker_trace.x = tuple(marker_trace.x) + tuple(xs)
+            marker_trace.y = tuple(marker_trace.y) + tuple(ys)
+            marker_trace.hovertext = tuple(marker_trace.hovertext) + tuple(names)
+            update['x'].append(xs)
+            update['y'].append(ys)
+            update['hovertext'].append(names)
+        self._submit('extendTraces', {'update': update, 'indices': [MIN_MARKER_TRACE, MAX_MARKER_TRACE]})
+
+    def _add_traces(self, new_traces):
+        """Append traces to the current figure and to the page, without a full render."""
+        self.current_fig.add_traces(new_traces)
+
+        added = self.current_fig.data[-len(new_traces):]
+        self._submit('addTraces', [trace.to_plotly_json() for trace in added])
+
+    @staticmethod
+    def _line_trace_type(n_points):
+        """Return the trace class for a curve line: WebGL for long curves, SVG otherwise."""
+        go = _go()
+        if config.USE_SCATTERGL and n_points >= config.SCATTERGL_MIN_POINTS:
+            return go.Scattergl
+        return go.Scatter
+
+    @staticmethod
+    def _is_reference_name(filename):
+        """Return True if the filename marks a reference (bare) measurement."""
+        name = filename.upper()
+        return 'BARE' in name or 'REFERENCE' in name
+
+    def _test_curve_trace(self, pot, cur, filename, color):
+        """
+        Build the line trace for one test curve.
+
+        Args:
+            pot: Potential values (numpy array)
+            cur: Current values (numpy array)
+            filename: Curve name for legend and hover text
+            color: Line color
+
+        Returns:
+            Plotly trace
+        """
+        plot_pot, plot_cur = lttb(pot, cur, config.PLOT_MAX_POINTS)
+
+        return self._line_trace_type(len(plot_pot))(
+            x=plot_pot,
+            y=plot_cur,
+            mode='lines',
+            name=filename,
+            line=dict(width=1.5, color=color),
+            opacity=config.TEST_LINE_ALPHA,
+            hovertemplate=f'<b>{filename}</b><br>Potential: %{{x:.4f}} V<br>Current: %{{y:.2e}} A<extra></extra>'
+        )
+
+    @staticmethod
+    def _curve_arrays(data):
+        """Return (potential, current) of a curve DataFrame as contiguous float64 arrays."""
+        return (
+            np.ascontiguousarray(data[config.POTENTIAL_COLUMN].to_numpy(), dtype=np.float64),
+            np.ascontiguousarray(data[config.CURRENT_COLUMN].to_numpy(), dtype=np.float64),
+        )
+
+    @staticmethod
+    def _curve_extrema(pot, cur):
+        """
+        Find the global min and max of a curve.
+
+        Args:
+            pot: Potential values (numpy array)
+            cur: Current values (numpy array)
+
+        Returns:
+            Tuple ((x_min, y_min), (x_max, y_max)) as Python floats
+        """
+        i_min = cur.argmin()
+        i_max = cur.argmax()
+        # argmin/argmax land on the first NaN if there is one; skip NaNs like idxmin did
+        if np.isnan(cur[i_min]):
+            i_min = np.nanargmin(cur)
+            i_max = np.nanargmax(cur)
+        return (float(pot[i_min]), float(cur[i_min])), (float(pot[i_max]), float(cur[i_max]))
+
+    @staticmethod
+    def _extrema_traces(extrema):
+        """
+        Build the shared min and max marker traces for all curves.
+
+        Args:
+            extrema: List of (name, (x_min, y_min), (x_max, y_max)) per curve
+
+        Returns:
+            List [min_trace, max_trace]
+        """
+        go = _go()
+        names = [name for name, _, _ in extrema]
+
+        traces = []
+        for k, label, symbol in ((1, 'Min', 'triangle-down'), (2, 'Max', 'triangle-up')):
+            traces.append(go.Scatter(
+                x=[e[k][0] for e in extrema],
+                y=[e[k][1] for e in extrema],
+                hovertext=names,
+                mode='markers',
+                marker=dict(size=12, color='limegreen', symbol=symbol),
+                name=label,
+                hovertemplate=f'<b>%{{hovertext}} {label}</b><br>Potential: %{{x:.4f}} V<br>Current: %{{y:.2e}} A<extra></extra>',
+                showlegend=False
+            ))
+        return traces
+
+    def _colorway(self):
+        """Return Plotly's default color sequence for the configured template."""
+        if self._colors is None:
+            import plotly.io as pio
+            colors = pio.templates[config.PLOT_TEMPLATE].layout.colorway
+            if not colors:
+                colors = pio.templates['plotly'].layout.colorway
+            self._colors = tuple(colors)
+        return self._colors
+
     def _render_figure(self, fig):
         """
         Render Plotly figure to the web view.
 
+        The page shell is loaded once; afterwards only the figure JSON is
+        pushed and Plotly.react updates the existing plot in place. JSON
+        encoding of a large figure is slow, so it runs on a worker thread.
+
         Args:
             fig: Plotly figure object
         """
         self.current_fig = fig
+        self._drop_queued_commands()
+        self._ensure_page()
+        self._submit('render', _figure_snapshot(fig))
 
-        # Configure interactivity
-        plotly_config = {
-            'editable': False,  # Disabled to allow eraseshape to work
-            'displayModeBar': True,
-            'modeBarButtonsToAdd': ['drawline', 'eraseshape'],
-            'modeBarButtonsToRemove': ['lasso2d', 'select2d'],
-            'toImageButtonOptions': {
-                'format': 'png',
-                'height': config.PLOT_EXPORT_HEIGHT,
-                'width': config.PLOT_EXPORT_WIDTH,
-                'scale': config.PLOT_EXPORT_SCALE
-            },
-            'displaylogo': False,
-        }
+    def _drop_queued_commands(self):
+        """Forget commands still waiting for the page; a full render supersedes them."""
+        self._js_generation += 1
+        self._js_jobs = []
+        self._pending_commands = []
 
-        # Generate HTML with embedded Plotly
-        html = fig.to_html(
-            include_plotlyjs='cdn',
-            config=plotly_config,
-            full_html=True
-        )
+    def _submit(self, name, payload):
+        """
+        Serialize payload in the thread pool, then send it to the page command `name`.
 
-        # Inject JavaScript for QWebChannel communication
-        webchannel_js = '''
-<script src="qrc:///qtwebchannel/qwebchannel.js"></script>
-<script>
-var bridge = null;
-new QWebChannel(qt.webChannelTransport, function(channel) {
-    bridge = channel.objects.bridge;
-});
+        Args:
+            name: Command in the page's `commands` table
+            payload: Snapshot dict/list that is not modified afterwards
+        """
+        job_id = self._next_job_id
+        self._next_job_id += 1
+        self._js_jobs.append([job_id, name, None])
 
-// Track shapes to detect new ones
-var previousShapeCount = 0;
+        generation = self._js_generation
+        done = lambda text, error: self._json_ready.emit(generation, job_id, text, error)
+        QThreadPool.globalInstance().start(_JsonTask(payload, done))
 
-document.addEventListener('DOMContentLoaded', function() {
-    var plotDiv = document.getElementsByClassName('plotly-graph-div')[0];
-    if (plotDiv) {
-        plotDiv.on('plotly_relayout', function(data) {
-            if (bridge && plotDiv.layout && plotDiv.layout.shapes) {
-                var shapes = plotDiv.layout.shapes;
-                if (shapes.length > previousShapeCount) {
-                    // New shape added
-                    var last = shapes[shapes.length - 1];
-                    if (last && last.type === 'line') {
-                        bridge.on_line_drawn(last.x0, last.y0, last.x1, last.y1);
-                    }
-                }
-                previousShapeCount = shapes.length;
-            }
-        });
-    }
-});
-</script>
-'''
-        # Insert webchannel script before closing body tag
-        html = html.replace('</body>', webchannel_js + '</body>')
+    def _on_json_ready(self, generation, job_id, text, error):
+        """Store a finished payload and send every command that is now in order."""
+        if generation != self._js_generation:
+            return
+
+        for i, job in enumerate(self._js_jobs):
+            if job[0] == job_id:
+                if error:
+                    # Drop the failed command so the ones queued after it still go out
+                    del self._js_jobs[i]
+                    self.plot_error.emit(error)
+                else:
+                    job[2] = text
+                break
+
+        while self._js_jobs and self._js_jobs[0][2] is not None:
+            _, name, text = self._js_jobs.pop(0)
+            self._send(name, text)
+
+    def _ensure_page(self):
+        """Load the plot page once; plotly.js is extracted to the user cache only once per version."""
+        if self._page_dir is not None:
+            return
+
+        import plotly
+        cache_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        if cache_root:
+            self._page_dir = os.path.join(cache_root, f'plotly-{plotly.__version__}')
+        else:
+            # Fixed name, so later sessions reuse the copy instead of adding one each time
+            self._page_dir = os.path.join(tempfile.gettempdir(), f'ferroci_plot-{plotly.__version__}')
+        os.makedirs(self._page_dir, exist_ok=True)
+
+        js_path = os.path.join(self._page_dir, 'plotly.min.js')
+        if not os.path.exists(js_path):
+            _write_atomic(js_path, pkgutil.get_data('plotly', 'package_data/plotly.min.js'))
+
+        # The page itself is tiny; rewrite it so it always matches this version of the app
+        page_path = os.path.join(self._page_dir, 'plot.html')
+        page_html = PAGE_HTML.replace('__PLOTLY_CONFIG__', json.dumps(PLOTLY_CONFIG))
+        _write_atomic(page_path, page_html.encode('utf-8'))
+
+        self.web_view.load(QUrl.fromLocalFile(page_path))
+
+    def _send(self, name, payload_json):
+        """Push a command over the web channel, holding it until the page is ready."""
+        if self._page_ready:
+            self.bridge.command.emit(name, payload_json)
+        else:
+            self._pending_commands.append((name, payload_json))
 
-        self.web_view.setHtml(html)
+    def handle_page_ready(self):
+        """Flush commands that were requested while the page was loading."""
+        self._page_ready = True
+        pending, self._pending_commands = self._pending_commands, []
+        for name, payload_json in pending:
+            self.bridge.command.emit(name, payload_json)
 
     def handle_line_drawn(self, x0, y0, x1, y1):
         """Store line coordinates when drawn."""
@@ -292,34 +647,46 @@ document.addEventListener('DOMContentLoaded', function() {
             self.intersection_calculated.emit(0)
             return
 
-        count = 0
+        go = _go()
+
+        # All drawn lines share one grey trace (None breaks the line between them)
+        line_x, line_y = [], []
+        hit_x, hit_y, hit_names = [], [], []
         for x0, y0, x1, y1 in self.drawn_lines:
-            # Add the line itself in grey
-            self.current_fig.add_trace(go.Scatter(
-                x=[x0, x1],
-                y=[y0, y1],
-                mode='lines',
-                line=dict(color='grey', width=2),
-                showlegend=False,
-                hoverinfo='skip'
+            line_x.extend((x0, x1, None))
+            line_y.extend((y0, y1, None))
+
+            for name, x, y in self._find_intersections(x0, y0, x1, y1):
+                hit_x.append(x)
+                hit_y.append(y)
+                hit_names.append(name)
+        count = len(hit_x)
+
+        new_traces = [go.Scatter(
+            x=line_x,
+            y=line_y,
+            mode='lines',
+            line=dict(color='grey', width=2),
+            showlegend=False,
+            hoverinfo='skip'
+        )]
+
+        # All intersection markers in one trace
+        if hit_x:
+            marker_type = go.Scattergl if config.USE_SCATTERGL else go.Scatter
+            new_traces.append(marker_type(
+                x=hit_x,
+                y=hit_y,
+                hovertext=hit_names,
+                mode='markers',
+                marker=dict(size=14, color='yellow', symbol='x',
+                           line=dict(width=2, color='black')),
+                name='Intersection',
+                hovertemplate='<b>%{hovertext}</b><br>Potential: %{x:.4f} V<br>Current: %{y:.2e} A<extra></extra>',
+                showlegend=False
             ))
 
-            # Add intersection markers
-            intersections = self._find_intersections(x0, y0, x1, y1)
-            for name, x, y in intersections:
-                self.current_fig.add_trace(go.Scatter(
-                    x=[x],
-                    y=[y],
-                    mode='markers',
-                    marker=dict(size=14, color='yellow', symbol='x',
-                               line=dict(width=2, color='black')),
-                    name='Intersection',
-                    hovertemplate=f'<b>{name}</b><br>Potential: {x:.4f} V<br>Current: {y:.2e} A<extra></extra>',
-                    showlegend=False
-                ))
-                count += 1
-
-        self._render_figure(self.current_fig)
+        self._add_traces(new_traces)
         self.intersection_calculated.emit(count)
 
     def _find_intersections(self, x0, y0, x1, y1):
@@ -333,49 +700,13 @@ document.addEventListener('DOMContentLoaded', function() {
         Returns:
             List of tuples (curve_name, x, y) for each intersection
         """
-        intersections = []
-
-        for name, data in self.curve_data.items():
-            x_vals = data[config.POTENTIAL_COLUMN].values
-            y_vals = data[config.CURRENT_COLUMN].values
-
-            # Check each segment of the curve
-            for i in range(len(x_vals) - 1):
-                pt = self._line_segment_intersection(
-                    x0, y0, x1, y1,
-                    x_vals[i], y_vals[i], x_vals[i + 1], y_vals[i + 1]
-                )
-                if pt is not None:
-                    intersections.append((name, pt[0], pt[1]))
-
-        return intersections
-
-    def _line_segment_intersection(self, x1, y1, x2, y2, x3, y3, x4, y4):
-        """
-        Find intersection point between two line segments.
-
-        Line 1: (x1, y1) to (x2, y2)
-        Line 2: (x3, y3) to (x4, y4)
-
-        Returns:
-            (x, y) tuple if segments intersect, None otherwise
-        """
-        denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
+        # All curves are stacked into one segment table, rebuilt only when curves change
+        if self._segments is None:
+            self._segments = (list(self.curve_data), build_segments(list(self.curve_data.values())))
+        names, segments = self._segments
 
-        if abs(denom) < 1e-10:
-            # Lines are parallel
-            return None
-
-        t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denom
-        u = -((x1 - x2) * (y1 - y3) - (y1 - y2) * (x1 - x3)) / denom
-
-        # Check if intersection is within both segments
-        if 0 <= t <= 1 and 0 <= u <= 1:
-            x = x1 + t * (x2 - x1)
-            y = y1 + t * (y2 - y1)
-            return (x, y)
-
-        return None
+        owner, xs, ys = find_intersections(x0, y0, x1, y1, segments)
+        return [(names[i], x, y) for i, x, y in zip(owner.tolist(), xs.tolist(), ys.tolist())]
 
     def _handle_download(self, download):
         """Handle download requests from Plotly toolbar with file dialog."""
@@ -405,30 +736,90 @@ document.addEventListener('DOMContentLoaded', function() {
         else:
             download.cancel()
 
+    def _export_scope(self):
+        """Return a long-lived kaleido scope, or None if kaleido lacks one."""
+        if self._kaleido_scope is None:
+            try:
+                from kaleido.scopes.plotly import PlotlyScope
+            except ImportError:
+                return None
+            self._kaleido_scope = PlotlyScope()
+        return self._kaleido_scope
+
     def save_plot(self, filepath):
         """
-        Save plot to file (PNG or PDF).
+        Save plot to file (PNG or PDF) in the background.
 
         Args:
             filepath: Path where to save the plot
+        """
+        self.save_plots([filepath])
 
-        Returns:
-            True if successful, False otherwise
+    def save_plots(self, filepaths):
+        """
+        Save plot to several files in the background, reusing one kaleido process.
+
+        Only a snapshot of the current figure is taken here; each file is
+        then reported through save_complete or save_error.
+
+        Args:
+            filepaths: Paths where to save the plot; format follows the extension
         """
         if self.current_fig is None:
             self.save_error.emit("No plot to save")
-            return False
+            return
 
-        try:
-            # Use kaleido for static export
-            self.current_fig.write_image(
-                filepath,
-                width=config.PLOT_EXPORT_WIDTH,
-                height=config.PLOT_EXPORT_HEIGHT,
-                scale=config.PLOT_EXPORT_SCALE
-            )
-            return True
-        except Exception as e:
-            self.save_error.emit(f"Error saving plot: {str(e)}")
-            return False
+        snapshot = _figure_snapshot(self.current_fig)
+        self._export_pool.start(_ExportTask(self._export_files, snapshot, list(filepaths)))
+
+    def _export_files(self, snapshot, filepaths):
+        """
+        Write a figure snapshot to image files (runs on the export thread).
 
+        Args:
+            snapshot: Figure dict from _figure_snapshot()
+            filepaths: Paths where to save the plot; format follows the extension
+        """
+        import plotly.io as pio
+
+        fig_hash = None
+        for filepath in filepaths:
+            try:
+                if fig_hash is None:
+                    fig_hash = hash(pio.json.to_json_plotly(snapshot))
+
+                # Kaleido export is slow, so don't rewrite an identical figure
+                if self._last_saved_hashes.get(filepath) == fig_hash and os.path.exists(filepath):
+                    self._export_done.emit(filepath, '')
+                    continue
+
+                scope = self._export_scope()
+                if scope is None:
+                    pio.write_image(
+                        snapshot,
+                        filepath,
+                        width=config.PLOT_EXPORT_WIDTH,
+                        height=config.PLOT_EXPORT_HEIGHT,
+                        scale=config.PLOT_EXPORT_SCALE
+                    )
+                else:
+                    image = scope.transform(
+                        snapshot,
+                        format=os.path.splitext(filepath)[1][1:].lower(),
+                        width=config.PLOT_EXPORT_WIDTH,
+                        height=config.PLOT_EXPORT_HEIGHT,
+                        scale=config.PLOT_EXPORT_SCALE
+                    )
+                    with open(filepath, 'wb') as f:
+                        f.write(image)
+                self._last_saved_hashes[filepath] = fig_hash
+                self._export_done.emit(filepath, '')
+            except Exception as e:
+                self._export_done.emit(filepath, f"Error saving plot: {str(e)}")
+
+    def _on_export_done(self, filepath, error):
+        """Report a finished export on the UI thread."""
+        if error:
+            self.save_error.emit(error)
+        else:
+            self.save_complete.emit(filepath)
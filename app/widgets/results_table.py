@@ -4,7 +4,8 @@ Results table widget for displaying analysis results.
 
 from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor
+from PyQt6.QtGui import QColor, QBrush
+import numpy as np
 import pandas as pd
 import config
 
@@ -28,6 +29,10 @@ class ResultsTableWidget(QTableWidget):
         self.setHorizontalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
         self.verticalHeader().setVisible(False)
 
+        # Reference row highlight, shared by all its cells
+        self._reference_background = QBrush(QColor(255, 255, 200))  # Light yellow
+        self._reference_foreground = QBrush(QColor(0, 0, 0))
+
     def update_results(self, results_df: pd.DataFrame):
         """
         Display results DataFrame in table.
@@ -39,42 +44,44 @@ class ResultsTableWidget(QTableWidget):
             self.clear()
             return
 
-        # Set dimensions
-        self.setRowCount(len(results_df))
-        self.setColumnCount(len(results_df.columns))
-        self.setHorizontalHeaderLabels(results_df.columns.tolist())
-
-        # Fill table
-        for i, row in results_df.iterrows():
-            is_reference = row.get(config.REFERENCE_FLAG_COLUMN, False)
-
-            for j, (col_name, value) in enumerate(row.items()):
-                # Format value
-                if pd.isna(value):
-                    text = "N/A"
-                elif isinstance(value, float):
-                    # Format floats with scientific notation if needed
-                    if abs(value) < 0.001 or abs(value) > 1000:
-                        text = f"{value:.3e}"
-                    else:
-                        text = f"{value:.6f}"
-                elif isinstance(value, bool):
-                    text = "Yes" if value else "No"
-                else:
-                    text = str(value)
-
-                item = QTableWidgetItem(text)
-
-                # Highlight reference row
-                if is_reference:
-                    item.setBackground(QColor(255, 255, 200))  # Light yellow
-                    item.setForeground(QColor(0, 0, 0))
-
-                # Center alignment for boolean and numeric columns
-                if col_name == config.REFERENCE_FLAG_COLUMN or isinstance(value, (int, float)):
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-
-                self.setItem(i, j, item)
+        n_rows = len(results_df)
+        columns = results_df.columns.tolist()
+
+        # Highlight reference rows (positional, whatever the index labels are)
+        if config.REFERENCE_FLAG_COLUMN in results_df.columns:
+            is_reference = [bool(v) for v in results_df[config.REFERENCE_FLAG_COLUMN].tolist()]
+        else:
+            is_reference = [False] * n_rows
+
+        self.setUpdatesEnabled(False)
+        try:
+            # Set dimensions
+            self.setRowCount(0)
+            self.setRowCount(n_rows)
+            self.setColumnCount(len(columns))
+            self.setHorizontalHeaderLabels(columns)
+
+            # Fill table column by column, formatting each column in one pass
+            for j, col_name in enumerate(columns):
+                texts, centered = self._format_column(results_df.iloc[:, j])
+                if col_name == config.REFERENCE_FLAG_COLUMN:
+                    centered = [True] * n_rows
+
+                for i, text in enumerate(texts):
+                    item = QTableWidgetItem(text)
+
+                    # Highlight reference row
+                    if is_reference[i]:
+                        item.setBackground(self._reference_background)
+                        item.setForeground(self._reference_foreground)
+
+                    # Center alignment for boolean and numeric columns
+                    if centered[i]:
+                        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+
+                    self.setItem(i, j, item)
+        finally:
+            self.setUpdatesEnabled(True)
 
         # Resize columns to content
         self.resizeColumnsToContents()
@@ -84,6 +91,63 @@ class ResultsTableWidget(QTableWidget):
             if self.columnWidth(col) < 100:
                 self.setColumnWidth(col, 100)
 
+    @staticmethod
+    def _format_column(column: pd.Series):
+        """
+        Format all cells of a column.
+
+        Args:
+            column: One results column
+
+        Returns:
+            Tuple (texts, centered) of per-row lists
+        """
+        # Extension dtypes (nullable ints, etc.) take the per-cell path
+        kind = column.dtype.kind if isinstance(column.dtype, np.dtype) else 'O'
+        n = len(column)
+
+        if kind == 'f':
+            values = column.to_numpy()
+            # Scientific notation for very small or large magnitudes
+            magnitude = np.abs(values)
+            scientific = ((magnitude < 0.001) | (magnitude > 1000)).tolist()
+            missing = np.isnan(values).tolist()
+            texts = [
+                "N/A" if nan else (f"{v:.3e}" if sci else f"{v:.6f}")
+                for v, sci, nan in zip(values.tolist(), scientific, missing)
+            ]
+            return texts, [True] * n
+
+        if kind == 'b':
+            return ["Yes" if v else "No" for v in column.tolist()], [True] * n
+
+        if kind in 'iu':
+            return [str(v) for v in column.tolist()], [True] * n
+
+        # Plain string columns (filenames, metadata) are shown as they are
+        if pd.api.types.infer_dtype(column, skipna=False) == 'string' and not column.isna().any():
+            return column.tolist(), [False] * n
+
+        # Mixed/object columns: format cell by cell
+        texts = []
+        centered = []
+        for value in column.astype(object).tolist():
+            if pd.isna(value):
+                text = "N/A"
+            elif isinstance(value, float):
+                # Format floats with scientific notation if needed
+                if abs(value) < 0.001 or abs(value) > 1000:
+                    text = f"{value:.3e}"
+                else:
+                    text = f"{value:.6f}"
+            elif isinstance(value, bool):
+                text = "Yes" if value else "No"
+            else:
+                text = str(value)
+            texts.append(text)
+            centered.append(isinstance(value, (int, float)))
+        return texts, centered
+
     def clear_results(self):
         """Clear all results from table."""
         self.setRowCount(0)
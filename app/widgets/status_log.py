@@ -3,6 +3,7 @@ Status log widget for displaying messages and logs.
 """
 
 from PyQt6.QtWidgets import QTextEdit
+from PyQt6.QtGui import QTextCursor, QTextCharFormat, QColor, QFont
 from datetime import datetime
 import config
 
@@ -17,6 +18,22 @@ class StatusLogWidget(QTextEdit):
         # Settings
         self.setReadOnly(True)
         self.setMaximumHeight(config.STATUS_LOG_HEIGHT)
+        self.document().setMaximumBlockCount(config.STATUS_LOG_MAX_LINES)  # Qt drops the oldest lines
+
+        # Color mapping, as (bold timestamp, message) formats per level
+        colors = {
+            'INFO': config.COLOR_INFO,
+            'ERROR': config.COLOR_ERROR,
+            'SUCCESS': config.COLOR_SUCCESS,
+            'WARNING': config.COLOR_WARNING
+        }
+        self._formats = {}
+        for level, color in colors.items():
+            message_format = QTextCharFormat()
+            message_format.setForeground(QColor(color))
+            timestamp_format = QTextCharFormat(message_format)
+            timestamp_format.setFontWeight(QFont.Weight.Bold)
+            self._formats[level] = (timestamp_format, message_format)
 
         # Styling
         self.setStyleSheet("""
@@ -42,21 +59,15 @@ class StatusLogWidget(QTextEdit):
             level: Log level (INFO, ERROR, SUCCESS, WARNING)
         """
         timestamp = datetime.now().strftime('%H:%M:%S')
+        timestamp_format, message_format = self._formats.get(level, self._formats['INFO'])
 
-        # Color mapping
-        colors = {
-            'INFO': config.COLOR_INFO,
-            'ERROR': config.COLOR_ERROR,
-            'SUCCESS': config.COLOR_SUCCESS,
-            'WARNING': config.COLOR_WARNING
-        }
-        color = colors.get(level, config.COLOR_INFO)
-
-        # Format message
-        formatted_message = f'<span style="color:{color}"><b>[{timestamp}]</b> {message}</span>'
-
-        # Append to log
-        self.append(formatted_message)
+        # Append as plain text with cached formats (no HTML parsing per line)
+        cursor = QTextCursor(self.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(f'[{timestamp}]', timestamp_format)
+        cursor.insertText(f' {message}', message_format)
 
         # Auto-scroll to bottom
         self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
@@ -20,11 +20,15 @@ PLOT_TEMPLATE = 'plotly_dark'  # Dark theme to match app
 PLOT_EXPORT_WIDTH = 1200
 PLOT_EXPORT_HEIGHT = 800
 PLOT_EXPORT_SCALE = 2  # For high-res exports
+PLOT_MAX_POINTS = 3000  # Longer curves are downsampled (LTTB) for display
+USE_SCATTERGL = True  # Draw long curves with WebGL instead of SVG
+SCATTERGL_MIN_POINTS = 1000  # Curves with fewer points stay SVG
 
 # UI settings
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 800
 STATUS_LOG_HEIGHT = 150
+STATUS_LOG_MAX_LINES = 2000  # Older log lines are discarded
 DROP_ZONE_MIN_HEIGHT = 75
 
 # Data column names
@@ -4,11 +4,16 @@ Data processor for orchestrating file processing and analysis.
 
 import os
 import pandas as pd
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Tuple, List, Callable, Optional
 from read_ferro_bare import read_ferro_bare_csv
 from core.metrics_registry import MetricsRegistry
 
 
+# Smaller batches are processed inline; a pool costs more than it saves
+PARALLEL_MIN_FILES = 2
+
+
 class DataProcessor:
     """Orchestrates file processing and metrics calculation."""
 
@@ -23,15 +28,27 @@ class DataProcessor:
         self.reference_data = None
         self.reference_metadata = None
         self.reference_filepath = None
-        self.results = []
+        self.results = []  # New result rows, folded into full_data_df on save
         self.all_processed_data = []  # Store for plotting
-        self.full_data_df = None  # DataFrame containing all processed data
+        self.full_data_df = None  # DataFrame of the results already saved/on disk
+        self._combined = None  # (full_data_df, results list, row count, combined DataFrame)
+        # One background writer, so workbooks are written in save order
+        self._excel_executor = ThreadPoolExecutor(max_workers=1)
 
 
     def set_reference(self, filepath: str) -> None:
-        """Load and set reference file."""
+        """
+        Load and set reference file.
+
+        Metrics prepare their reference-only work (sweep split, sorting)
+        here once, instead of for every test file.
+
+        Args:
+            filepath: Path to reference CSV file
+        """
         self.reference_metadata, self.reference_data = read_ferro_bare_csv(filepath)
         self.reference_filepath = filepath
+        self.metrics_registry.prime_reference(self.reference_data)
 
     def load_existing_data(self, directory: str) -> None:
         """
@@ -43,7 +60,9 @@ class DataProcessor:
         csv_path = os.path.join(directory, 'data.csv')
         if os.path.exists(csv_path):
             try:
-                self.full_data_df = pd.read_csv(csv_path)
+                # Infer column types in one pass over the whole file (not per
+                # chunk, which can leave mixed-type columns in long histories)
+                self.full_data_df = pd.read_csv(csv_path, low_memory=False, memory_map=True)
                 print(f"Loaded {len(self.full_data_df)} existing entries from data.csv")
             except Exception as e:
                 print(f"Error loading existing data.csv: {str(e)}")
@@ -61,15 +80,53 @@ class DataProcessor:
         """
         # Read CSV
         metadata, data = read_ferro_bare_csv(filepath)
+        self._add_result(metadata.iloc[0].to_dict(), data)
+
+        return metadata, data
+
+    def _add_result(self, metadata: dict, data: pd.DataFrame) -> None:
+        """
+        Calculate metrics for parsed file data and append to results.
+
+        Args:
+            metadata: Metadata dict (becomes the result row)
+            data: DataFrame with Potential_V and Current_A columns
+        """
+        self.results.append(self._make_result(metadata, data))
+
+    def _make_result(self, metadata: dict, data: pd.DataFrame) -> dict:
+        """
+        Calculate metrics for parsed file data.
 
+        Args:
+            metadata: Metadata dict (becomes the result row)
+            data: DataFrame with Potential_V and Current_A columns
+
+        Returns:
+            dict: Result row (metadata + metrics + is_reference flag)
+        """
         # Calculate all metrics
         metrics = self.metrics_registry.calculate_all(data, self.reference_data)
 
-        # Merge metadata + metrics + flag
-        result = {**metadata.iloc[0].to_dict(), **metrics, 'is_reference': False}
-        self.results.append(result)
+        # Merge metrics + flag into the metadata dict in place
+        result = metadata
+        result.update(metrics)
+        result['is_reference'] = False
+        return result
 
-        return metadata, data
+    def _read_and_measure(self, filepath: str) -> Tuple[pd.DataFrame, dict]:
+        """
+        Parse one file and calculate its metrics (safe to run in a worker thread).
+
+        Args:
+            filepath: Path to test CSV file
+
+        Returns:
+            Tuple of (data, result row)
+        """
+        # A metadata dict skips building a single-row DataFrame per file
+        metadata, data = read_ferro_bare_csv(filepath, return_dict=True)
+        return data, self._make_result(metadata, data)
 
     def process_batch(
         self,
@@ -93,27 +150,56 @@ class DataProcessor:
             raise ValueError("Reference file must be set before processing batch")
         reference_filename = os.path.basename(self.reference_filepath)
 
-        for i, filepath in enumerate(filepaths):
+        # Parse files and calculate metrics in parallel; pandas parsing and
+        # the numpy metric kernels release the GIL for most of their work
+        outcomes = [None] * len(filepaths)
+        if len(filepaths) < PARALLEL_MIN_FILES:
+            for done, filepath in enumerate(filepaths, 1):
+                try:
+                    outcomes[done - 1] = self._read_and_measure(filepath)
+                except Exception as e:
+                    print(f"Error processing {filepath}: {str(e)}")
+
+                # Call progress callback if provided
+                if progress_callback:
+                    progress_callback(done, len(filepaths))
+        else:
+            max_workers = min(len(filepaths), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._read_and_measure, filepath): i
+                    for i, filepath in enumerate(filepaths)
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    i = futures[future]
+                    try:
+                        outcomes[i] = future.result()
+                    except Exception as e:
+                        print(f"Error processing {filepaths[i]}: {str(e)}")
+
+                    # Call progress callback if provided
+                    if progress_callback:
+                        progress_callback(done, len(filepaths))
+
+        # Collect results in input order so they stay deterministic
+        for filepath, outcome in zip(filepaths, outcomes):
+            if outcome is None:
+                continue
             try:
-                metadata, data = self.process_file(filepath)
+                data, result = outcome
+                self.results.append(result)
                 filename = os.path.basename(filepath)
                 processed_data.append((data, filename))
                 self.all_processed_data.append((data, filename))
 
-                # Update the last result added by process_file()
                 # Add ReferenceFilename column and set is_reference flag
-                last_result = self.results[-1]
-                last_result['ReferenceFilename'] = reference_filename
+                result['ReferenceFilename'] = reference_filename
 
                 # Set is_reference flag based on whether this is the reference file
                 if filepath == self.reference_filepath:
-                    last_result['is_reference'] = True
+                    result['is_reference'] = True
                 else:
-                    last_result['is_reference'] = False
-
-                # Call progress callback if provided
-                if progress_callback:
-                    progress_callback(i + 1, len(filepaths))
+                    result['is_reference'] = False
 
             except Exception as e:
                 print(f"Error processing {filepath}: {str(e)}")
@@ -121,53 +207,107 @@ class DataProcessor:
 
         return processed_data
 
-    def get_results_dataframe(self) -> pd.DataFrame:
+    def get_results_dataframe(self, include_reference: bool = True) -> pd.DataFrame:
         """
         Get full results DataFrame (includes both existing and new data).
 
+        New results are only combined here, not stored; save_results()
+        folds them into full_data_df. The combined frame is reused until
+        rows are added, so repeated calls do not concatenate again.
+
+        Args:
+            include_reference: If False, drop rows flagged as reference
+
         Returns:
             DataFrame with all results
         """
-        # If we have existing data, append new results to it
-        if self.full_data_df is not None:
-            if self.results:
-                new_df = pd.DataFrame(self.results)
-                self.full_data_df = pd.concat([self.full_data_df, new_df], ignore_index=True)
-                self.results = []  # Clear after merging
-            return self.full_data_df
+        combined = self._combined
+        if not self.results:
+            df = self.full_data_df if self.full_data_df is not None else pd.DataFrame()
+        elif (combined is not None and combined[0] is self.full_data_df
+              and combined[1] is self.results and combined[2] == len(self.results)):
+            # Results are only ever appended, so same list + same length = same rows
+            df = combined[3]
         else:
-            # No existing data, just return current results
-            return pd.DataFrame(self.results)
-
-    def save_results(self, directory: str) -> Tuple[str, str]:
+            if self.full_data_df is None or self.full_data_df.empty:
+                # Single frame, nothing to concatenate
+                df = pd.DataFrame(self.results)
+            else:
+                df = pd.concat([self.full_data_df, pd.DataFrame(self.results)], ignore_index=True)
+            self._combined = (self.full_data_df, self.results, len(self.results), df)
+
+        if include_reference or 'is_reference' not in df.columns:
+            return df
+        return df[df['is_reference'] == False]
+
+    def save_results(
+        self,
+        directory: str,
+        write_excel: bool = False
+    ) -> Tuple[str, str, Optional[Future]]:
         """
-        Save results as CSV and Excel in specified directory.
+        Save results as CSV (and optionally Excel) in specified directory.
+
+        The CSV is written before returning. openpyxl is slow, so the Excel
+        copy is written on a background thread.
 
         Args:
             directory: Directory where to save results
+            write_excel: Also write data.xlsx
 
         Returns:
-            Tuple of (csv_path, excel_path)
+            Tuple of (csv_path, excel_path, excel_future); excel_future is
+            None unless write_excel is set, and resolves to True once the
+            workbook is written (False if that failed)
         """
         df = self.get_results_dataframe()  # This now returns full DataFrame
 
         csv_path = os.path.join(directory, 'data.csv')
         excel_path = os.path.join(directory, 'data.xlsx')
 
-        # Fill NaN values with empty strings to preserve manually added columns
-        df = df.fillna('')
+        # Save CSV (overwrites with complete data); NaN is written as an
+        # empty cell to preserve manually added columns, without a filled copy.
+        # The temp file + rename means an interrupted save never leaves a
+        # half-written data.csv behind
+        tmp_path = f"{csv_path}.{os.getpid()}.tmp"
+        try:
+            df.to_csv(tmp_path, index=False, na_rep='')
+            os.replace(tmp_path, csv_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        # The saved rows are now the existing data
+        self.full_data_df = df
+        self.results = []
+
+        # Save Excel in the background (df is not modified afterwards)
+        excel_future = None
+        if write_excel:
+            excel_future = self._excel_executor.submit(self._write_excel, df, excel_path)
 
-        # Save CSV (overwrites with complete data)
-        df.to_csv(csv_path, index=False)
+        return csv_path, excel_path, excel_future
 
-        # Save Excel
+    @staticmethod
+    def _write_excel(df: pd.DataFrame, excel_path: str) -> bool:
+        """
+        Write results DataFrame to an Excel workbook.
+
+        Args:
+            df: Results to write
+            excel_path: Destination .xlsx path
+
+        Returns:
+            True if successful, False otherwise
+        """
         try:
-            df.to_excel(excel_path, index=False, engine='openpyxl')
+            df.to_excel(excel_path, index=False, na_rep='', engine='openpyxl')
+            return True
         except Exception as e:
             print(f"Error saving Excel: {str(e)}")
             # Excel export is optional
-
-        return csv_path, excel_path
+            return False
 
     def clear_results(self) -> None:
         """Clear all results (useful for starting fresh)."""
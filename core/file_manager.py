@@ -41,10 +41,12 @@ class FileManager:
             return None
 
         try:
-            df = pd.read_csv(self.data_csv_path)
-            ref_row = df[df['is_reference'] == True]
-            if not ref_row.empty:
-                return ref_row.iloc[0]['Filename']
+            # Only the two columns needed here are parsed
+            df = pd.read_csv(self.data_csv_path, usecols=['is_reference', 'Filename'])
+            # First flagged row, read straight from the columns (no filtered copy)
+            is_reference = (df['is_reference'] == True).to_numpy()
+            if is_reference.any():
+                return df['Filename'].iat[is_reference.argmax()]
         except Exception as e:
             print(f"Error loading reference from data.csv: {str(e)}")
 
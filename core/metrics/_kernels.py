@@ -0,0 +1,72 @@
+"""
+Numeric kernels shared by the curve metrics.
+"""
+
+import numpy as np
+
+
+def interp_linear(x, x_ref, y_ref):
+    """
+    Linearly interpolate a reference curve at x, extrapolating past its ends.
+
+    Args:
+        x: Points to evaluate at (numpy array)
+        x_ref: Reference x values, sorted ascending (numpy array)
+        y_ref: Reference y values (numpy array)
+
+    Returns:
+        numpy array of reference y values at x
+    """
+    # Linear interpolation in one C loop
+    y_interp = np.interp(x, x_ref, y_ref)
+
+    # np.interp clamps beyond the reference range; extrapolate linearly
+    # from the two edge points instead
+    below = x < x_ref[0]
+    if below.any():
+        slope = (y_ref[1] - y_ref[0]) / (x_ref[1] - x_ref[0])
+        y_interp[below] = y_ref[0] + slope * (x[below] - x_ref[0])
+    above = x > x_ref[-1]
+    if above.any():
+        slope = (y_ref[-1] - y_ref[-2]) / (x_ref[-1] - x_ref[-2])
+        y_interp[above] = y_ref[-2] + slope * (x[above] - x_ref[-2])
+
+    return y_interp
+
+
+def abs_diff_integral(x, y, y_ref):
+    """
+    Integrate |y - y_ref| over x with the trapezoidal rule.
+
+    Args:
+        x: Sample points (numpy array)
+        y: Curve values at x (numpy array)
+        y_ref: Reference values at x (numpy array)
+
+    Returns:
+        float: Integral, negative when x runs downwards
+    """
+    diff = y - y_ref
+    np.abs(diff, out=diff)  # Reuse the difference buffer
+
+    # Trapezoidal rule sum(dx * (d[i] + d[i+1])) / 2 as two dot products
+    # on views, so the pairwise sums are never materialized
+    dx = np.diff(x)
+    return 0.5 * (np.dot(diff[1:], dx) + np.dot(diff[:-1], dx))
+
+
+def diff_range(y, y_ref):
+    """
+    Range (max - min) of y - y_ref point by point, ignoring NaNs.
+
+    Args:
+        y: Curve values (numpy array)
+        y_ref: Reference values (numpy array); only the common length is used
+
+    Returns:
+        float: max - min of the differences
+    """
+    n = min(len(y), len(y_ref))
+    diff = y[:n] - y_ref[:n]
+    # fmax/fmin skip NaNs like nanmax/nanmin, minus their per-call wrapper work
+    return np.fmax.reduce(diff) - np.fmin.reduce(diff)
@@ -6,9 +6,27 @@ the required abstract methods.
 """
 
 from abc import ABC, abstractmethod
+from typing import Dict, Optional
+import numpy as np
 import pandas as pd
 
 
+def arrays_from_df(data_df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Extract the curve columns metrics work on as numpy arrays.
+
+    Args:
+        data_df: DataFrame with columns: Potential_V, Current_A
+
+    Returns:
+        dict: Column name -> numpy array
+    """
+    return {
+        'Potential_V': data_df['Potential_V'].to_numpy(),
+        'Current_A': data_df['Current_A'].to_numpy(),
+    }
+
+
 class BaseMetric(ABC):
     """Abstract base class for analysis metrics."""
 
@@ -38,19 +56,45 @@ class BaseMetric(ABC):
         pass
 
     @abstractmethod
-    def calculate(self, data_df: pd.DataFrame, ref_data_df: pd.DataFrame) -> float:
+    def calculate(
+        self,
+        data: Dict[str, np.ndarray],
+        ref_data: Dict[str, np.ndarray],
+        ctx: Optional[dict] = None
+    ) -> float:
         """
         Calculate the metric value for given data against reference.
 
+        Both curves come as dicts of numpy arrays (see arrays_from_df), so
+        metrics index columns without pandas overhead.
+
+        The `ctx` parameter is optional in subclasses. Metrics that accept
+        it get one dict per test file, shared by all metrics, to reuse
+        intermediate results such as 'interpolated_sweeps' (see
+        CurveDifferenceMetric) instead of computing them again.
+
         Args:
-            data_df: Test data DataFrame with columns: Potential_V, Current_A
-            ref_data_df: Reference data DataFrame with columns: Potential_V, Current_A
+            data: Test data arrays with keys: Potential_V, Current_A
+            ref_data: Reference data arrays with keys: Potential_V, Current_A
+            ctx: Shared per-file cache dict, or None
 
         Returns:
             float: Calculated metric value
         """
         pass
 
+    def prime_reference(self, ref_data: Dict[str, np.ndarray]) -> None:
+        """
+        Prepare reference-only work before a batch of calculate() calls.
+
+        Override this method to cache whatever your metric derives from the
+        reference alone. The default does nothing.
+
+        Args:
+            ref_data: Reference data arrays with keys: Potential_V, Current_A
+        """
+        pass
+
     def requires_interpolation(self) -> bool:
         """
         Indicate whether this metric requires reference interpolation.
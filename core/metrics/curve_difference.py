@@ -5,13 +5,22 @@ Calculates the sum of absolute differences between test curve and reference curv
 """
 
 import numpy as np
-import pandas as pd
+from typing import Dict, Optional
 from core.metrics.base_metric import BaseMetric
-from scipy import integrate
+from core.metrics._kernels import interp_linear, abs_diff_integral
 
 class CurveDifferenceMetric(BaseMetric):
     """Metric that calculates sum of absolute differences between curves."""
 
+    def __init__(self):
+        """Initialize metric and the prepared-reference cache."""
+        super().__init__()
+        # (reference arrays, their sorted forward/backward sweeps); holding
+        # the reference keeps the identity check valid
+        self._ref_cache = None
+        # id(sweep) -> (sweep, test grid, reference current on it), last grid per sweep
+        self._interp_memo = {}
+
     def get_name(self) -> str:
         """Return metric name for CSV column."""
         return "Sum_Abs_Difference"
@@ -47,15 +56,12 @@ class CurveDifferenceMetric(BaseMetric):
             >>> len(bwd_pot)  # indices 3-6 (inclusive, with overlap at 3)
             4
         """
-        # Convert to numpy arrays if pandas Series
-        if hasattr(potential, 'values'):
-            potential = potential.values
-        if hasattr(current, 'values'):
-            current = current.values
+        # Convert to numpy arrays (no copy for arrays, cheap for Series)
+        potential = np.asarray(potential)
+        current = np.asarray(current)
         
-        # Find maximum and minimum indices
+        # Find maximum index
         max_idx = np.argmax(potential)
-        min_idx = np.argmin(potential)
         
         # Check if max is near the edges (indicates inverted scan)
         n = len(potential)
@@ -63,8 +69,8 @@ class CurveDifferenceMetric(BaseMetric):
         
         if max_idx < edge_threshold or max_idx > (n - edge_threshold):
             # Max is at edge → likely inverted scan (high → low → high)
-            # Use minimum as transition point
-            transition_idx = min_idx
+            # Use minimum as transition point (only scanned in this case)
+            transition_idx = np.argmin(potential)
         else:
             # Max is in middle → standard scan (low → high → low)
             # Use maximum as transition point
@@ -81,6 +87,92 @@ class CurveDifferenceMetric(BaseMetric):
         
         return forward_potential, forward_current, backward_potential, backward_current
 
+    def prime_reference(self, ref_data: Dict[str, np.ndarray]) -> None:
+        """
+        Split and sort the reference sweeps once for all test files.
+
+        Args:
+            ref_data: Reference data arrays with Potential_V and Current_A keys
+        """
+        self._prepared_reference(ref_data)
+
+    def _prepared_reference(self, ref_data):
+        """
+        Return the reference forward/backward sweeps, prepared for interpolation.
+
+        Args:
+            ref_data: Reference data arrays with Potential_V and Current_A keys
+
+        Returns:
+            Tuple of (forward, backward) sweeps from _prepare_sweep()
+        """
+        # Read the cache once; worker threads may replace it concurrently
+        cache = self._ref_cache
+        if cache is None or cache[0] is not ref_data:
+            x_ref, y_ref, xb_ref, yb_ref = self._split_forward_backward(
+                ref_data["Potential_V"], ref_data["Current_A"])
+            prepared = (self._prepare_sweep(x_ref, y_ref), self._prepare_sweep(xb_ref, yb_ref))
+            cache = self._ref_cache = (ref_data, prepared)
+            self._interp_memo = {}
+        return cache[1]
+
+    @staticmethod
+    def _prepare_sweep(x_ref, y_ref):
+        """
+        Sort one reference sweep by potential and note whether its grid can be reused.
+
+        Args:
+            x_ref: Reference potential values of the sweep (numpy array)
+            y_ref: Reference current values of the sweep (numpy array)
+
+        Returns:
+            Tuple of (sorted potentials, matching currents, grid); grid is
+            the unsorted (x_ref, y_ref) pair if the potentials are distinct,
+            else None
+        """
+        # np.interp needs increasing sample points (interp1d sorted them too)
+        order = np.argsort(x_ref, kind='mergesort')
+        x_sorted = x_ref[order]
+        y_sorted = y_ref[order]
+
+        # On its own distinct grid, interpolation returns the currents unchanged
+        grid = (x_ref, y_ref) if np.all(np.diff(x_sorted) > 0) else None
+        return x_sorted, y_sorted, grid
+
+    @staticmethod
+    def _same_grid(x, x_grid):
+        """Return True if x equals x_grid, with cheap length/endpoint checks first."""
+        return (len(x) == len(x_grid) and x[0] == x_grid[0] and x[-1] == x_grid[-1]
+                and np.array_equal(x, x_grid))
+
+    def _reference_at(self, x, sweep):
+        """
+        Reference current at test potentials, skipping interpolation on a known grid.
+
+        The reference's own grid needs no interpolation; a grid already
+        interpolated for the previous file reuses that result.
+
+        Args:
+            x: Test potential values (numpy array)
+            sweep: Prepared reference sweep from _prepare_sweep()
+
+        Returns:
+            Reference current at the x points (numpy array, not to be modified)
+        """
+        x_ref, y_ref, grid = sweep
+        if grid is not None and self._same_grid(x, grid[0]):
+            return grid[1]
+
+        # Files from one instrument run tend to share a grid; the entry holds
+        # the sweep itself, so a recycled id() can never match
+        memo = self._interp_memo.get(id(sweep))
+        if memo is not None and memo[0] is sweep and self._same_grid(x, memo[1]):
+            return memo[2]
+
+        y_ref_interp = self._interpolate_reference_to_test(x, x_ref, y_ref)
+        self._interp_memo[id(sweep)] = (sweep, x, y_ref_interp)
+        return y_ref_interp
+
     def _interpolate_reference_to_test(self, x, x_ref, y_ref):
         """
         Interpolate reference current to test potential values.
@@ -90,65 +182,71 @@ class CurveDifferenceMetric(BaseMetric):
         
         Args:
             x: Test potential values (numpy array)
-            x_ref: Reference potential values (numpy array)
+            x_ref: Reference potential values, sorted ascending (numpy array)
             y_ref: Reference current values (numpy array)
         
         Returns:
             y_ref_interp: Reference current interpolated at test potential (x) points
         """
-        from scipy.interpolate import interp1d
-        
-        # Create interpolation function
-        # kind='linear': linear interpolation (standard for CV)
-        # bounds_error=False: don't raise error if test extends beyond ref
-        # fill_value='extrapolate': extrapolate at boundaries if needed
-        f_interp = interp1d(
-            x_ref,
-            y_ref,
-            kind='linear',
-            bounds_error=False,
-            fill_value='extrapolate'
-        )
-        
-        # Apply interpolation: get ref current at test potential values
-        y_ref_interp = f_interp(x)
-        
-        return y_ref_interp
+        # Linear, extrapolating past the reference ends like interp1d did
+        return interp_linear(x, x_ref, y_ref)
 
 
-    def calculate(self, data_df: pd.DataFrame, ref_data_df: pd.DataFrame) -> float:
+    def interpolated_sweeps(self, data, ref_data, ctx=None):
         """
-        Calculate sum of absolute differences.
+        Split the test curve and get the reference current at its potentials.
 
-        Calculates sum of absolute differences.
+        The result is stored in `ctx` under 'interpolated_sweeps', so other
+        metrics of the same file can reuse it.
 
         Args:
-            data_df: Test data with Potential_V and Current_A columns
-            ref_data_df: Reference data with Potential_V and Current_A columns
+            data: Test data arrays with Potential_V and Current_A keys
+            ref_data: Reference data arrays with Potential_V and Current_A keys
+            ctx: Shared per-file cache dict, or None
 
         Returns:
-            float: Sum of absolute differences
+            Tuple of ((x, y, y_ref), (xb, yb, yb_ref)): forward and backward
+            test sweeps with the reference current at their potentials
         """
+        if ctx is not None and 'interpolated_sweeps' in ctx:
+            return ctx['interpolated_sweeps']
 
         # Split into forward and backward sweeps
-        dummy = self._split_forward_backward(  data_df["Potential_V"], 
-                                           data_df["Current_A"])
-        x , y, xb, yb = dummy
-        dummy_ref = self._split_forward_backward(  ref_data_df["Potential_V"], 
-                                                    ref_data_df["Current_A"])
-        x_ref, y_ref, xb_ref, yb_ref = dummy_ref
+        x, y, xb, yb = self._split_forward_backward(data["Potential_V"], data["Current_A"])
+        # Reference sweeps are split and sorted once per reference
+        sweep, sweep_b = self._prepared_reference(ref_data)
 
         # Interpolate reference to test potentials
-        y_ref_interp = self._interpolate_reference_to_test(x, x_ref, y_ref)
-        yb_ref_interp = self._interpolate_reference_to_test(xb, xb_ref, yb_ref)
+        sweeps = ((x, y, self._reference_at(x, sweep)), (xb, yb, self._reference_at(xb, sweep_b)))
+        if ctx is not None:
+            ctx['interpolated_sweeps'] = sweeps
+        return sweeps
+
+    def calculate(
+        self,
+        data: Dict[str, np.ndarray],
+        ref_data: Dict[str, np.ndarray],
+        ctx: Optional[dict] = None
+    ) -> float:
+        """
+        Calculate sum of absolute differences.
+
+        Calculates sum of absolute differences.
+
+        Args:
+            data: Test data arrays with Potential_V and Current_A keys
+            ref_data: Reference data arrays with Potential_V and Current_A keys
+            ctx: Shared per-file cache dict, or None
+
+        Returns:
+            float: Sum of absolute differences
+        """
 
-        # Calculate differences
-        y_diff = np.abs(y - y_ref_interp)
-        yb_diff = np.abs(yb - yb_ref_interp)
+        (x, y, y_ref_interp), (xb, yb, yb_ref_interp) = self.interpolated_sweeps(data, ref_data, ctx)
 
-        # Integrate using trapezoidal rule
-        y_int = integrate.trapezoid(y_diff, x=x)
-        yb_int = integrate.trapezoid(yb_diff, x=xb)
+        # Integrate absolute differences using trapezoidal rule
+        y_int = abs_diff_integral(x, y, y_ref_interp)
+        yb_int = abs_diff_integral(xb, yb, yb_ref_interp)
 
         # Return sum of absolute integrated differences
         return np.abs(y_int) + np.abs(yb_int)
\ No newline at end of file
@@ -6,7 +6,7 @@ Copy this file and modify to create your own custom metrics.
 """
 
 import numpy as np
-import pandas as pd
+from typing import Dict
 from core.metrics.base_metric import BaseMetric
 
 
@@ -34,20 +34,20 @@ class ExampleMetric(BaseMetric):
         """
         return "Example metric - replace with your own calculation"
 
-    def calculate(self, data_df: pd.DataFrame, ref_data_df: pd.DataFrame) -> float:
+    def calculate(self, data: Dict[str, np.ndarray], ref_data: Dict[str, np.ndarray]) -> float:
         """
         Calculate your custom metric.
 
         Args:
-            data_df: Test data with Potential_V and Current_A columns
-            ref_data_df: Reference data with Potential_V and Current_A columns
+            data: Test data arrays with Potential_V and Current_A keys
+            ref_data: Reference data arrays with Potential_V and Current_A keys
 
         Returns:
             float: Your calculated metric value
         """
         # Example: Calculate maximum current (doesn't use reference)
         # Replace with your own calculation logic
-        return data_df["Current_A"].max()
+        return data["Current_A"].max()
 
     def requires_interpolation(self) -> bool:
         """
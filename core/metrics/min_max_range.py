@@ -5,8 +5,9 @@ Calculates the range (max - min) of differences between test and reference curve
 """
 
 import numpy as np
-import pandas as pd
+from typing import Dict
 from core.metrics.base_metric import BaseMetric
+from core.metrics._kernels import diff_range
 
 
 class MinMaxDifferenceMetric(BaseMetric):
@@ -20,7 +21,7 @@ class MinMaxDifferenceMetric(BaseMetric):
         """Return human-readable description."""
         return "Range (max - min) of differences between test and reference curves"
 
-    def calculate(self, data_df: pd.DataFrame, ref_data_df: pd.DataFrame) -> float:
+    def calculate(self, data: Dict[str, np.ndarray], ref_data: Dict[str, np.ndarray]) -> float:
         """
         Calculate min-max range of differences.
 
@@ -28,15 +29,13 @@ class MinMaxDifferenceMetric(BaseMetric):
         then calculates the range (max - min) of differences.
 
         Args:
-            data_df: Test data with Potential_V and Current_A columns
-            ref_data_df: Reference data with Potential_V and Current_A columns
+            data: Test data arrays with Potential_V and Current_A keys
+            ref_data: Reference data arrays with Potential_V and Current_A keys
 
         Returns:
             float: Range of differences (max - min)
         """
 
-        # Calculate difference
-        diff = data_df["Current_A"] - ref_data_df["Current_A"]
-
-        # Return range (max - min)
-        return diff.max() - diff.min()
+        # Range of point-by-point differences over the common length
+        # (as pandas index alignment did for the DataFrame columns)
+        return diff_range(data["Current_A"], ref_data["Current_A"])
@@ -1,26 +1,25 @@
 """
 Metrics registry for managing and calculating analysis metrics.
 
-Uses singleton pattern to ensure only one registry instance exists.
+The application creates one registry in main.py and passes it to the
+components that need it.
 """
 
+import inspect
 import numpy as np
 import pandas as pd
 from typing import Dict
-from core.metrics.base_metric import BaseMetric
+from core.metrics.base_metric import BaseMetric, arrays_from_df
 
 
 class MetricsRegistry:
-    """Singleton registry for extensible metrics."""
+    """Registry for extensible metrics."""
 
-    _instance = None
-
-    def __new__(cls):
-        """Create singleton instance if it doesn't exist."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.metrics = {}
-        return cls._instance
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.metrics = {}
+        self._ctx_metrics = set()  # Names of metrics whose calculate() takes ctx
+        self._ref_arrays = None  # (reference DataFrame, its arrays)
 
     def register(self, metric: BaseMetric) -> None:
         """
@@ -30,6 +29,10 @@ class MetricsRegistry:
             metric: Instance of a class inheriting from BaseMetric
         """
         self.metrics[metric.name] = metric
+        if 'ctx' in inspect.signature(metric.calculate).parameters:
+            self._ctx_metrics.add(metric.name)
+        else:
+            self._ctx_metrics.discard(metric.name)
 
     def get_all(self) -> Dict[str, BaseMetric]:
         """
@@ -49,10 +52,21 @@ class MetricsRegistry:
         """
         return list(self.metrics.keys())
 
+    def _reference_arrays(self, ref_data_df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Return the reference arrays, extracted once per reference DataFrame."""
+        cache = self._ref_arrays  # Read once; may be replaced from another thread
+        if cache is None or cache[0] is not ref_data_df:
+            cache = self._ref_arrays = (ref_data_df, arrays_from_df(ref_data_df))
+        return cache[1]
+
     def calculate_all(self, data_df: pd.DataFrame, ref_data_df: pd.DataFrame) -> Dict[str, float]:
         """
         Calculate all registered metrics.
 
+        The columns are extracted to numpy arrays once and shared by all metrics.
+        Metrics that accept `ctx` also share one cache dict for this file, so
+        intermediate results (e.g. the interpolated reference) are computed once.
+
         Args:
             data_df: Test data DataFrame with columns: Potential_V, Current_A
             ref_data_df: Reference data DataFrame with columns: Potential_V, Current_A
@@ -60,16 +74,40 @@ class MetricsRegistry:
         Returns:
             dict: Dictionary of metric name -> calculated value
         """
+        data = arrays_from_df(data_df)
+        ref_data = self._reference_arrays(ref_data_df)
+
+        ctx = {}
+
         results = {}
         for name, metric in self.metrics.items():
             try:
-                results[name] = metric.calculate(data_df, ref_data_df)
+                if name in self._ctx_metrics:
+                    results[name] = metric.calculate(data, ref_data, ctx=ctx)
+                else:
+                    results[name] = metric.calculate(data, ref_data)
             except Exception as e:
                 # Log error and store NaN for failed calculations
                 print(f"Error calculating {name}: {str(e)}")
                 results[name] = np.nan
         return results
 
+    def prime_reference(self, ref_data_df: pd.DataFrame) -> None:
+        """
+        Let all registered metrics prepare their reference-only work.
+
+        Args:
+            ref_data_df: Reference data DataFrame with columns: Potential_V, Current_A
+        """
+        ref_data = self._reference_arrays(ref_data_df)
+        for name, metric in self.metrics.items():
+            try:
+                metric.prime_reference(ref_data)
+            except Exception as e:
+                # calculate() reports the same problem per file
+                print(f"Error preparing reference for {name}: {str(e)}")
+
     def clear(self) -> None:
         """Clear all registered metrics (useful for testing)."""
         self.metrics = {}
+        self._ctx_metrics = set()
@@ -13,7 +13,6 @@ a = Analysis(
         'PyQt6.QtCore',
         'PyQt6.QtGui',
         'PyQt6.QtWidgets',
-        'matplotlib.backends.backend_qt5agg',
         'pandas',
         'numpy',
         'openpyxl',
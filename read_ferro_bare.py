@@ -1,25 +1,64 @@
+import io
+import mmap
+import os
+import re
 import pandas as pd
 import numpy as np
-from typing import Tuple, Dict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Tuple, Dict, List, Optional, Union
 
 
-def read_ferro_bare_csv(filepath: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+# Line starting the data section, through its line break
+_DATA_HEADER = re.compile(rb'(?:^|(?<=[\r\n]))[ \t]*Potential/V[^\r\n]*(?:\r\n?|\n)?')
+_NON_SPACE = re.compile(rb'\S')
+
+# Header lines "key = value" (split at the first '=') and "key: value"
+# (split at the first ':'), with the whitespace around the separator dropped
+_ASSIGNMENT = re.compile(r'([^=]*?)\s*=\s*(.*)')
+_LABEL = re.compile(r'([^:]*?)\s*:\s*(.*)')
+
+# Numeric header values: plain integers, and decimals/exponents as floats
+_INT = re.compile(r'[+-]?\d+')
+_FLOAT = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+# Header labels renamed to their own column: from "key: value" lines, and
+# from lines left to the fallback branch (a run of spaces after the colon)
+_LABEL_COLUMNS = {'File': 'File_Path'}
+_SPACED_LABEL_COLUMNS = {'Data Source': 'Data_Source', 'Instrument Model': 'Instrument_Model'}
+
+# Number of parsed files kept in memory for unchanged re-reads
+_CACHE_SIZE = 32
+
+
+def read_ferro_bare_csv(
+    filepath: str,
+    return_dict: bool = False
+) -> Tuple[Union[pd.DataFrame, Dict], pd.DataFrame]:
     """
     Read a FERRO BARE.csv file containing cyclic voltammetry data.
 
     This function extracts metadata from the header section and the
     potential-current relationship from the data section.
 
+    Parsed files are cached in memory and re-read only when their
+    modification time or size changes; every call returns fresh copies.
+
     Parameters
     ----------
     filepath : str
         Path to the FERRO BARE.csv file
+    return_dict : bool, optional
+        Return the metadata as a plain dict instead of a single-row
+        DataFrame. Callers reading many files can then build one DataFrame
+        from all dicts at the end.
 
     Returns
     -------
-    metadata_df : pd.DataFrame
+    metadata_df : pd.DataFrame or dict
         Single-row DataFrame containing all metadata fields that can be merged with other files.
         Columns include experimental parameters like scan rate, initial/high/low potential, etc.
+        With return_dict=True, a dict of the same fields.
     data_df : pd.DataFrame
         DataFrame with columns ['Potential_V', 'Current_A'] containing the voltage-current measurements
 
@@ -29,65 +68,220 @@ def read_ferro_bare_csv(filepath: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
     >>> print(metadata.columns)
     >>> print(data.head())
     """
+    stat = os.stat(filepath)
+    metadata, data_df = _read_file(filepath, stat.st_mtime_ns, stat.st_size)
 
-    # Initialize metadata dictionary
-    metadata = {}
+    # The cached objects are shared, so callers get their own copies
+    metadata = dict(metadata)
+    if not return_dict:
+        metadata = pd.DataFrame([metadata])
+    return metadata, data_df.copy()
 
-    # Read the file line by line
-    with open(filepath, 'r') as f:
-        lines = f.readlines()
 
-    # Parse metadata from header (lines before "Potential/V, Current/A")
-    data_start_idx = None
-    for idx, line in enumerate(lines):
-        line = line.strip()
+def read_ferro_bare_metadata(filepath: str, return_dict: bool = False) -> Union[pd.DataFrame, Dict]:
+    """
+    Read only the metadata of a FERRO BARE.csv file.
+
+    The data section is located but not parsed, which makes this much
+    cheaper than read_ferro_bare_csv() for indexing passes.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the FERRO BARE.csv file
+    return_dict : bool, optional
+        Return a plain dict instead of a single-row DataFrame
+
+    Returns
+    -------
+    metadata_df : pd.DataFrame or dict
+        Metadata as returned by read_ferro_bare_csv()
+    """
+    with open(filepath, 'rb') as f:
+        header_end, _, _ = _locate_data(f)
+        f.seek(0)
+        header = f.read(header_end)
+
+    return _build_metadata(_parse_header(header), filepath, return_dict)
+
+
+def read_ferro_bare_data(filepath: str) -> pd.DataFrame:
+    """
+    Read only the potential-current data of a FERRO BARE.csv file.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the FERRO BARE.csv file
+
+    Returns
+    -------
+    data_df : pd.DataFrame
+        DataFrame with columns ['Potential_V', 'Current_A'] as returned by
+        read_ferro_bare_csv()
+    """
+    with open(filepath, 'rb') as f:
+        _, data_start, has_data = _locate_data(f)
+        return _parse_data(f, data_start, has_data)
+
+
+def read_ferro_bare_batch(
+    filepaths: List[str],
+    n_workers: Optional[int] = None
+) -> Tuple[pd.DataFrame, List[pd.DataFrame]]:
+    """
+    Read many FERRO BARE.csv files, parsing them in worker processes.
+
+    Worker processes sidestep the GIL for the Python-side header parsing.
+    Starting them takes a moment, so this pays off for larger campaigns;
+    scripts using it on Windows need the usual `if __name__ == "__main__"`
+    guard.
+
+    Parameters
+    ----------
+    filepaths : list of str
+        Paths of the files to read
+    n_workers : int, optional
+        Number of worker processes (default: number of CPUs); 1 reads the
+        files in this process
+
+    Returns
+    -------
+    metadata_df : pd.DataFrame
+        One metadata row per file, in the order of `filepaths`
+    data_dfs : list of pd.DataFrame
+        Data of each file, in the order of `filepaths`
+    """
+    n_workers = min(n_workers or os.cpu_count() or 1, len(filepaths))
+    if n_workers <= 1:
+        results = [read_ferro_bare_csv(filepath, return_dict=True) for filepath in filepaths]
+    else:
+        # A few chunks per worker keeps the load balanced while sending
+        # several files per round trip
+        chunksize = max(1, len(filepaths) // (4 * n_workers))
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            results = list(executor.map(
+                partial(read_ferro_bare_csv, return_dict=True), filepaths, chunksize=chunksize
+            ))
+
+    # One DataFrame from all metadata dicts instead of one per file
+    metadata_df = pd.DataFrame([metadata for metadata, _ in results])
+    return metadata_df, [data for _, data in results]
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _read_file(filepath: str, mtime_ns: int, size: int) -> Tuple[Dict, pd.DataFrame]:
+    """
+    Parse a whole file; cached, so the results must not be modified.
+
+    Parameters
+    ----------
+    filepath : str
+        Path to the FERRO BARE.csv file
+    mtime_ns : int
+        Modification time of the file (only part of the cache key)
+    size : int
+        Size of the file (only part of the cache key)
 
-        # Replace commas to avoid csv parsing issues
-        line = line.replace(',', '.')
+    Returns
+    -------
+    metadata : dict
+        Metadata fields including 'Filename'
+    data_df : pd.DataFrame
+        DataFrame with columns ['Potential_V', 'Current_A']
+    """
+    with open(filepath, 'rb') as f:
+        header_end, data_start, has_data = _locate_data(f)
+        f.seek(0)
+        header = f.read(header_end)
+        data_df = _parse_data(f, data_start, has_data)
+
+    return _build_metadata(_parse_header(header), filepath, True), data_df
 
-        # Check if we've reached the data section
-        if line.startswith('Potential/V'):
-            data_start_idx = idx + 1  # Data starts after the header line
-            break
+
+def _locate_data(f) -> Tuple[int, int, bool]:
+    """
+    Find the 'Potential/V, Current/A' line that starts the data section.
+
+    The file is searched through a memory map, so only the header part is
+    ever split into lines.
+
+    Parameters
+    ----------
+    f : file object
+        File opened in binary mode
+
+    Returns
+    -------
+    header_end : int
+        Byte offset of the 'Potential/V' line
+    data_start : int
+        Byte offset just past that line
+    has_data : bool
+        Whether anything but whitespace follows
+
+    Raises
+    ------
+    ValueError
+        If the file has no data header
+    """
+    # An empty file cannot be mapped (and has no header anyway)
+    if f.seek(0, io.SEEK_END):
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            match = _DATA_HEADER.search(mm)
+            if match is not None:
+                header_end, data_start = match.span()
+                return header_end, data_start, _NON_SPACE.search(mm, data_start) is not None
+    raise ValueError("Could not find 'Potential/V, Current/A' header in file")
+
+
+def _parse_header(header: bytes) -> Dict:
+    """
+    Parse the metadata fields from the header section.
+
+    Parameters
+    ----------
+    header : bytes
+        File content before the 'Potential/V' line
+
+    Returns
+    -------
+    metadata : dict
+        Field name -> value (int, float or str)
+    """
+    # Initialize metadata dictionary
+    metadata = {}
+
+    for idx, line in enumerate(_decode(header).splitlines()):
+        line = line.strip()
 
         # Skip empty lines and section markers
         if not line or line in ['Results:', 'Channel 1:', 'Header:', 'Note:'] or line.startswith('Segment'):
             continue
 
         # Parse key-value pairs
-        if '=' in line:
-            key, value = line.split('=', 1)
-            key = key.strip()
-            value = value.strip()
-
-            # Try to convert to numeric if possible
-            try:
-                # Handle scientific notation
-                if 'e' in value.lower():
-                    value = float(value)
-                elif '.' in value:
-                    value = float(value)
-                else:
-                    value = int(value)
-            except ValueError:
-                pass  # Keep as string
-
-            metadata[key] = value
-        elif ':' in line and '=' not in line and '   ' not in line:
-            # Handle lines like "Sept. 12, 2025   15:54:51" or "File: ..."
-            parts = line.split(':', 1)
-            if len(parts) == 2:
-                key = parts[0].strip()
-                value = parts[1].strip()
-
-                # Create descriptive key names
-                if key == 'File':
-                    metadata['File_Path'] = value
-                elif 'Cyclic Voltammetry' not in line:
-                    # For date/time lines or other metadata
-                    if not key:  # Handle cases like the timestamp
-                        continue
-                    metadata[key] = value
+        assignment = _ASSIGNMENT.match(line)
+        label = None
+        if assignment is None and '   ' not in line:
+            # Handle lines like "File: ..." ("Sept. 12, 2025   15:54:51" is
+            # left to the DateTime branch below)
+            label = _LABEL.match(line)
+
+        if assignment is not None:
+            key, value = assignment.groups()
+            metadata[key] = _parse_value(value)
+        elif label is not None:
+            key, value = label.groups()
+
+            # Create descriptive key names
+            column = _LABEL_COLUMNS.get(key)
+            if column is not None:
+                metadata[column] = value
+            elif 'Cyclic Voltammetry' not in line:
+                # For date/time lines or other metadata
+                if not key:  # Handle cases like the timestamp
+                    continue
+                metadata[key] = value
         else:
             # Handle first line (date and time)
             if idx == 0:
@@ -98,27 +292,154 @@ def read_ferro_bare_csv(filepath: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
             # Handle other single-value lines
             elif idx < 10 and line:  # Only for header section
                 # Try to extract useful info
-                if 'Data Source' in line:
-                    metadata['Data_Source'] = line.split(':', 1)[1].strip()
-                elif 'Instrument Model' in line:
-                    metadata['Instrument_Model'] = line.split(':', 1)[1].strip()
+                key, colon, value = line.partition(':')
+                column = _SPACED_LABEL_COLUMNS.get(key.rstrip())
+                if colon and column is not None:
+                    metadata[column] = value.strip()
 
-    # Create single-row DataFrame from metadata
-    metadata_df = pd.DataFrame([metadata])
+    return metadata
+
+
+def _build_metadata(metadata: Dict, filepath: str, return_dict: bool) -> Union[pd.DataFrame, Dict]:
+    """
+    Add the filename to the parsed header fields and wrap them up.
+
+    Parameters
+    ----------
+    metadata : dict
+        Parsed header fields (updated in place)
+    filepath : str
+        Path of the file the fields came from
+    return_dict : bool
+        Return the dict itself instead of a single-row DataFrame
 
+    Returns
+    -------
+    metadata_df : pd.DataFrame or dict
+        Metadata with a trailing 'Filename' field
+    """
     # Add the filename as a column for tracking
-    import os
-    metadata_df['Filename'] = os.path.basename(filepath)
+    metadata['Filename'] = os.path.basename(filepath)
+
+    if return_dict:
+        return metadata
 
-    # Parse the data section
-    if data_start_idx is None:
-        raise ValueError("Could not find 'Potential/V, Current/A' header in file")
+    # Create single-row DataFrame from metadata
+    return pd.DataFrame([metadata])
 
-    # Read data lines and parse them
-    potentials = []
-    currents = []
 
-    for line in lines[data_start_idx:]:
+def _parse_data(f, data_start: int, has_data: bool) -> pd.DataFrame:
+    """
+    Parse the potential-current data section.
+
+    Parameters
+    ----------
+    f : file object
+        File opened in binary mode
+    data_start : int
+        Byte offset of the first data line
+    has_data : bool
+        Whether the data section contains anything but whitespace
+
+    Returns
+    -------
+    data_df : pd.DataFrame
+        DataFrame with columns ['Potential_V', 'Current_A']
+    """
+    # numpy's C loader parses the numeric block straight from the file into
+    # float64, with no type inference (it warns on input without data,
+    # hence has_data)
+    f.seek(data_start)
+    try:
+        if has_data:
+            values = np.loadtxt(f, delimiter=',', dtype=np.float64, comments=None, ndmin=2)
+        else:
+            values = np.empty((0, 2))
+    except ValueError:
+        values = None
+
+    if values is not None and values.shape[1] == 2:
+        # Building from columns gives each column contiguous memory
+        return pd.DataFrame({'Potential_V': values[:, 0], 'Current_A': values[:, 1]})
+
+    # Extra fields, stray text, empty fields or bare CR line ends:
+    # use the tolerant line parser
+    f.seek(data_start)
+    return _parse_data_lines(_decode(f.read()).splitlines())
+
+
+def _parse_value(value: str):
+    """
+    Convert a header value to int or float if it looks numeric.
+
+    A decimal comma ("0,05") is read as a decimal point.
+
+    Parameters
+    ----------
+    value : str
+        Stripped value text
+
+    Returns
+    -------
+    value : int, float or str
+        int for plain integers, float for decimals and exponents,
+        otherwise the text unchanged (commas included)
+    """
+    number = value.replace(',', '.') if ',' in value else value
+
+    # Matching the number shape up front avoids raising ValueError for
+    # every text value
+    if _INT.fullmatch(number):
+        return int(number)
+    if _FLOAT.fullmatch(number):
+        return float(number)
+    return value
+
+
+def _decode(raw: bytes) -> str:
+    """
+    Decode file text as UTF-8, falling back to Latin-1.
+
+    Instrument software on Windows often writes a legacy code page; Latin-1
+    maps every byte, so such files still load instead of failing outright.
+
+    Parameters
+    ----------
+    raw : bytes
+        Raw file content
+
+    Returns
+    -------
+    text : str
+        Decoded text
+    """
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return raw.decode('latin-1')
+
+
+def _parse_data_lines(lines: List[str]) -> pd.DataFrame:
+    """
+    Parse potential-current data line by line, skipping unparseable lines.
+
+    Parameters
+    ----------
+    lines : list of str
+        Lines of the data section
+
+    Returns
+    -------
+    data_df : pd.DataFrame
+        DataFrame with columns ['Potential_V', 'Current_A']
+    """
+    # At most one row per line: fill preallocated arrays instead of growing
+    # lists and converting them afterwards
+    potentials = np.empty(len(lines))
+    currents = np.empty(len(lines))
+    n_rows = 0
+
+    for line in lines:
         line = line.strip()
         if not line:
             continue
@@ -129,20 +450,19 @@ def read_ferro_bare_csv(filepath: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
             if len(parts) == 2:
                 potential = float(parts[0].strip())
                 current = float(parts[1].strip())
-                potentials.append(potential)
-                currents.append(current)
+                potentials[n_rows] = potential
+                currents[n_rows] = current
+                n_rows += 1
         except ValueError:
             # Skip lines that can't be parsed as numbers
             continue
 
     # Create DataFrame for potential-current data
-    data_df = pd.DataFrame({
-        'Potential_V': potentials,
-        'Current_A': currents
+    return pd.DataFrame({
+        'Potential_V': potentials[:n_rows],
+        'Current_A': currents[:n_rows]
     })
 
-    return metadata_df, data_df
-
 
 if __name__ == "__main__":
     # Example usage
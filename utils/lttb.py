@@ -0,0 +1,154 @@
+"""
+Largest-Triangle-Three-Buckets downsampling for plotting long curves.
+"""
+
+import numpy as np
+
+
+def lttb(x, y, n_out):
+    """
+    Reduce a curve to about `n_out` points for display (Largest-Triangle-Three-Buckets).
+
+    Interior points are split into buckets; from each bucket the point
+    spanning the largest triangle with the neighbouring bucket means is
+    kept. Anchoring on the previous bucket's mean instead of its selected
+    point lets all buckets be evaluated at once with NumPy. First and last
+    points are always kept.
+
+    Non-finite points split the curve into pieces that are downsampled
+    separately; one point of each gap is kept, so the plot still shows
+    the break. A curve with more pieces than `n_out` allows is returned
+    unchanged.
+
+    Args:
+        x: Potential values (numpy array)
+        y: Current values (numpy array)
+        n_out: Maximum number of points to keep
+
+    Returns:
+        Tuple of (x, y) numpy arrays, unchanged if already small enough
+
+    Examples:
+        >>> x = np.arange(5000.0)
+        >>> y = np.sin(x / 100)
+        >>> y[2500] = np.nan
+        >>> x_out, y_out = lttb(x, y, 3000)
+        >>> len(x_out), int(np.isnan(y_out).sum())
+        (3000, 1)
+    """
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    finite = np.isfinite(x) & np.isfinite(y)
+    if finite.all():
+        keep = _lttb_indices(x, y, n_out)
+        return x[keep], y[keep]
+
+    # Split into runs of finite and non-finite points
+    bounds = np.concatenate(([0], np.flatnonzero(finite[1:] != finite[:-1]) + 1, [n]))
+    segments = list(zip(bounds[:-1], bounds[1:]))
+    runs = [(start, stop) for start, stop in segments if finite[start]]
+    n_gaps = len(segments) - len(runs)
+    budget = n_out - n_gaps
+    if budget < len(runs):
+        return x, y
+
+    shares = iter(_share_budget(np.array([stop - start for start, stop in runs]), budget))
+    pieces = []
+    for start, stop in segments:
+        if not finite[start]:
+            # One point stands for the whole gap
+            pieces.append([start])
+            continue
+        length, share = stop - start, next(shares)
+        if share >= length:
+            pieces.append(np.arange(start, stop))
+        elif share >= 3:
+            pieces.append(start + _lttb_indices(x[start:stop], y[start:stop], share))
+        else:
+            # Too few points for triangles: keep the run's ends
+            pieces.append([start, stop - 1][:share])
+    keep = np.concatenate(pieces).astype(np.intp)
+    return x[keep], y[keep]
+
+
+def _share_budget(lengths, budget):
+    """
+    Split a point budget over runs in proportion to their lengths.
+
+    Args:
+        lengths: Number of points per run (numpy array)
+        budget: Points to hand out, at least one per run
+
+    Returns:
+        numpy array of points per run, each between 1 and its length,
+        summing to min(budget, lengths.sum())
+    """
+    total = lengths.sum()
+    if total <= budget:
+        return lengths
+
+    exact = lengths * (budget / total)
+    shares = np.clip(np.floor(exact).astype(np.intp), 1, lengths)
+
+    # Settle the rounding, most under-served runs first
+    order = np.argsort(shares - exact)
+    missing = budget - shares.sum()
+    while missing > 0:
+        for i in order:
+            if missing and shares[i] < lengths[i]:
+                shares[i] += 1
+                missing -= 1
+    while missing < 0:
+        for i in order[::-1]:
+            if missing and shares[i] > 1:
+                shares[i] -= 1
+                missing += 1
+    return shares
+
+
+def _lttb_indices(x, y, n_out):
+    """
+    Indices of the points LTTB keeps from a finite curve.
+
+    Args:
+        x: Potential values (numpy array, all finite)
+        y: Current values (numpy array, all finite)
+        n_out: Number of points to keep (3 <= n_out < len(x))
+
+    Returns:
+        Sorted numpy array of exactly `n_out` indices
+    """
+    n = len(x)
+
+    # Bucket boundaries over the interior points 1 .. n-2
+    n_buckets = n_out - 2
+    starts = np.linspace(1, n - 1, n_buckets + 1).astype(np.intp)[:-1]
+    sizes = np.diff(np.append(starts, n - 1))
+    bucket = np.repeat(np.arange(n_buckets), sizes)
+
+    xi = x[1:n - 1]
+    yi = y[1:n - 1]
+    mean_x = np.add.reduceat(xi, starts - 1) / sizes
+    mean_y = np.add.reduceat(yi, starts - 1) / sizes
+
+    # Anchors: previous bucket mean (first point for bucket 0),
+    # next bucket mean (last point for the final bucket)
+    ax = np.concatenate(([x[0]], mean_x[:-1]))[bucket]
+    ay = np.concatenate(([y[0]], mean_y[:-1]))[bucket]
+    cx = np.concatenate((mean_x[1:], [x[-1]]))[bucket]
+    cy = np.concatenate((mean_y[1:], [y[-1]]))[bucket]
+
+    area = np.abs((ax - cx) * (yi - ay) - (ax - xi) * (cy - ay))
+
+    # First index of each bucket's maximum area. NaN areas never win, but
+    # a bucket of only NaN areas still gives its first point, so every
+    # bucket keeps exactly one
+    area[np.isnan(area)] = -np.inf
+    is_max = area == np.repeat(np.maximum.reduceat(area, starts - 1), sizes)
+    candidates = np.flatnonzero(is_max)
+    _, first = np.unique(bucket[candidates], return_index=True)
+    keep = np.concatenate(([0], candidates[first] + 1, [n - 1]))
+
+    return keep